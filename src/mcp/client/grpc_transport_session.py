@@ -32,6 +32,8 @@ LATEST_PROTOCOL_VERSION = types.LATEST_PROTOCOL_VERSION
 logger = logging.getLogger(__name__)
 
 ChannelArgumentType = Sequence[tuple[str, Any]]
+# Shared default for requests that carry no common fields; protobuf copies it into each request.
+_EMPTY_COMMON = mcp_pb2.RequestFields()
 
 
 class GRPCTransportSession(TransportSession):
@@ -289,7 +291,7 @@ class GRPCTransportSession(TransportSession):
     async def read_resource(self, uri: AnyUrl) -> types.ReadResourceResult:
         """Send a resources/read request."""
         request = mcp_pb2.ReadResourceRequest(
-            common=mcp_pb2.RequestFields(),
+            common=_EMPTY_COMMON,
             uri=str(uri),
         )
         try:
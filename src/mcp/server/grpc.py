@@ -64,7 +64,7 @@ class McpServicer(mcp_pb2_grpc.McpServicer):
                 common=mcp_pb2.ResponseFields(),
                 resources=resource_protos,
             )
-            response.ttl.CopyFrom(convert.ttl_from_timedelta(self.list_resources_ttl))
+            convert.ttl_from_timedelta_into(response.ttl, self.list_resources_ttl)
             return response
         except json_format.ParseError as e:
             error_message = f"Failed to parse resource data: {e}"
@@ -92,7 +92,7 @@ class McpServicer(mcp_pb2_grpc.McpServicer):
                 common=mcp_pb2.ResponseFields(),
                 resource_templates=resource_template_protos,
             )
-            response.ttl.CopyFrom(convert.ttl_from_timedelta(self.list_resource_templates_ttl))
+            convert.ttl_from_timedelta_into(response.ttl, self.list_resource_templates_ttl)
             return response
         except json_format.ParseError as e:
             error_message = f"Failed to parse resource template data: {e}"
@@ -163,7 +163,7 @@ class McpServicer(mcp_pb2_grpc.McpServicer):
                 common=mcp_pb2.ResponseFields(),
                 tools=tool_protos,
             )
-            response.ttl.CopyFrom(convert.ttl_from_timedelta(self.list_tools_ttl))
+            convert.ttl_from_timedelta_into(response.ttl, self.list_tools_ttl)
             return response
         except json_format.ParseError as e:
             error_message = f"Failed to parse tool data: {e}"
@@ -9,6 +9,7 @@ from pydantic import AnyUrl
 import mcp.types as types
 from mcp.proto import mcp_pb2
 from mcp.server.transport_session import TransportSession
+from mcp.shared import convert
 
 logger = logging.getLogger(__name__)
 
@@ -59,17 +60,7 @@ class GrpcSession(TransportSession):
         related_request_id: types.RequestId | None = None,
     ) -> None:
         """Puts a progress notification onto the response queue."""
-        progress_proto = mcp_pb2.ProgressNotification(
-            progress_token=str(progress_token),
-            progress=progress,
-        )
-        if total is not None:
-            progress_proto.total = total
-        if message is not None:
-            progress_proto.message = message
-
-        response = mcp_pb2.CallToolResponse(common=mcp_pb2.ResponseFields(progress=progress_proto))
-        await self._response_queue.put(response)
+        await self._response_queue.put(convert.progress_notification_to_proto(progress_token, progress, total, message))
 
     async def send_resource_list_changed(self) -> None:
         """This is not needed for gRPC, as we rely on TTL."""
@@ -1,13 +1,17 @@
 """Utilities for converting between MCP types and protobuf messages."""
 
-import base64
+import binascii
+import functools
 import json
 import logging
-from collections.abc import Iterable, Sequence
+import math
+from collections.abc import Callable, Iterable, Sequence
 from datetime import timedelta
 from typing import Any, TypeAlias, cast
 
-import jsonschema
+from jsonschema.exceptions import ValidationError, best_match  # type: ignore[reportUnknownVariableType]
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
 
 from google.protobuf import duration_pb2  # isort: skip
 from google.protobuf import json_format  # isort: skip
@@ -22,36 +26,96 @@ from mcp.types import ErrorData, Role
 
 logger = logging.getLogger(__name__)
 
+_ROLE_STR_TO_PROTO: dict[Role, mcp_pb2.Role] = {
+    "user": mcp_pb2.ROLE_USER,
+    "assistant": mcp_pb2.ROLE_ASSISTANT,
+}
+_ROLE_PROTO_TO_STR: dict[mcp_pb2.Role, Role] = {v: k for k, v in _ROLE_STR_TO_PROTO.items()}
+
+# A handful of MIME types repeat across every decoded message; mapping them
+# through a fixed table shares one string per type. Unknown types pass through
+# untouched, so peer-controlled values are never pinned in memory.
+_KNOWN_MIME_TYPES: dict[str, str] = {
+    mime_type: mime_type
+    for mime_type in (
+        "text/plain",
+        "text/html",
+        "text/markdown",
+        "application/json",
+        "application/octet-stream",
+        "image/png",
+        "image/jpeg",
+        "audio/mpeg",
+        "audio/wav",
+    )
+}
+
+# Parsing a URI into an AnyUrl dominates the decode side of resource and
+# content conversion, and the same URIs come back on every list call. AnyUrl
+# values are immutable, so parsed instances are shared; invalid URIs still
+# raise, since exceptions are not cached. Only short URIs are cached so that
+# large ones (e.g. data: URIs) are not kept alive by the cache.
+_MAX_CACHED_URI_LENGTH = 256
+_cached_any_url = functools.lru_cache(maxsize=1024)(AnyUrl)
+
+
+def _any_url(uri: str) -> AnyUrl:
+    if len(uri) > _MAX_CACHED_URI_LENGTH:
+        return AnyUrl(uri)
+    return _cached_any_url(uri)
+
+
+def _mime_type(mime_type: str) -> str:
+    return _KNOWN_MIME_TYPES.get(mime_type, mime_type)
+
 
 def ttl_from_timedelta(ttl_timedelta: timedelta) -> duration_pb2.Duration:
     """Converts a timedelta to a duration_pb2.Duration proto."""
-    ttl_float = ttl_timedelta.total_seconds()
-    seconds = int(ttl_float)
-    nanos = int((ttl_float - seconds) * 1_000_000_000)
-    return duration_pb2.Duration(seconds=seconds, nanos=nanos)
+    ttl = duration_pb2.Duration()
+    ttl_from_timedelta_into(ttl, ttl_timedelta)
+    return ttl
+
+
+def ttl_from_timedelta_into(ttl: duration_pb2.Duration, ttl_timedelta: timedelta) -> None:
+    """Writes a timedelta into an existing Duration, e.g. a response's ttl field."""
+    # Integer math on the timedelta's own fields; total_seconds() goes through
+    # a float and loses precision for large values.
+    seconds = ttl_timedelta.days * 86400 + ttl_timedelta.seconds
+    nanos = ttl_timedelta.microseconds * 1000
+    if seconds < 0 and nanos:
+        # timedelta normalizes to non-negative microseconds, Duration wants
+        # seconds and nanos to share a sign.
+        seconds += 1
+        nanos -= 1_000_000_000
+    ttl.seconds = seconds
+    ttl.nanos = nanos
 
 
 def timedelta_from_ttl(ttl: duration_pb2.Duration) -> timedelta:
     """Converts a TTL proto to a timedelta."""
-    return timedelta(seconds=ttl.seconds + ttl.nanos / 1e9)
+    return timedelta(seconds=ttl.seconds, microseconds=ttl.nanos // 1000)
+
+
+def _annotations_type_to_proto(annotations: types.Annotations) -> mcp_pb2.Annotations:
+    """Converts a types.Annotations object to an Annotations protobuf message."""
+    return mcp_pb2.Annotations(
+        audience=[_ROLE_STR_TO_PROTO[role] for role in annotations.audience or ()],
+        priority=annotations.priority if annotations.priority is not None else 0.0,
+    )
+
+
+def _annotations_proto_to_type(annotations_proto: mcp_pb2.Annotations) -> types.Annotations:
+    """Converts an Annotations protobuf message to a types.Annotations object."""
+    # ROLE_UNSPECIFIED and roles unknown to this version are dropped.
+    audience = [_ROLE_PROTO_TO_STR[role] for role in annotations_proto.audience if role in _ROLE_PROTO_TO_STR]
+    return types.Annotations.model_construct(
+        audience=audience,
+        priority=annotations_proto.priority,
+    )
 
 
 def resource_type_to_proto(resource: types.Resource) -> mcp_pb2.Resource:
     """Converts a types.Resource object to a Resource protobuf message."""
-    proto_annotations = None
-    if resource.annotations:
-        audience: list[mcp_pb2.Role] = []
-        if resource.annotations.audience:
-            for role in resource.annotations.audience:
-                if role == "user":
-                    audience.append(mcp_pb2.ROLE_USER)
-                elif role == "assistant":
-                    audience.append(mcp_pb2.ROLE_ASSISTANT)
-        proto_annotations = mcp_pb2.Annotations(
-            audience=audience,
-            priority=resource.annotations.priority if resource.annotations.priority is not None else 0.0,
-        )
-
     return mcp_pb2.Resource(
         uri=str(resource.uri),
         name=resource.name,
@@ -59,7 +123,7 @@ def resource_type_to_proto(resource: types.Resource) -> mcp_pb2.Resource:
         description=resource.description,
         mime_type=resource.mimeType,
         size=resource.size if resource.size is not None else 0,
-        annotations=proto_annotations,
+        annotations=_annotations_type_to_proto(resource.annotations) if resource.annotations else None,
     )
 
 
@@ -74,23 +138,14 @@ def resource_proto_to_type(resource_proto: mcp_pb2.Resource) -> types.Resource:
     """Converts a Resource protobuf message to a types.Resource object."""
     annotations = None
     if resource_proto.HasField("annotations"):
-        audience: list[Role] = []
-        for role in resource_proto.annotations.audience:
-            if role == mcp_pb2.ROLE_USER:
-                audience.append("user")
-            elif role == mcp_pb2.ROLE_ASSISTANT:
-                audience.append("assistant")
-        annotations = types.Annotations(
-            audience=audience,
-            priority=resource_proto.annotations.priority,
-        )
+        annotations = _annotations_proto_to_type(resource_proto.annotations)
 
-    return types.Resource(
-        uri=AnyUrl(resource_proto.uri),
+    return types.Resource.model_construct(
+        uri=_any_url(resource_proto.uri),
         name=resource_proto.name,
         title=resource_proto.title,
         description=resource_proto.description,
-        mimeType=resource_proto.mime_type,
+        mimeType=_mime_type(resource_proto.mime_type),
         size=resource_proto.size if resource_proto.size != 0 else None,
         annotations=annotations,
     )
@@ -107,29 +162,14 @@ def resource_template_type_to_proto(
     resource_template: types.ResourceTemplate,
 ) -> mcp_pb2.ResourceTemplate:
     """Converts a types.ResourceTemplate object to a ResourceTemplate protobuf message."""
-    proto_annotations = None
-    if resource_template.annotations:
-        audience: list[mcp_pb2.Role] = []
-        if resource_template.annotations.audience:
-            for role in resource_template.annotations.audience:
-                if role == "user":
-                    audience.append(mcp_pb2.ROLE_USER)
-                elif role == "assistant":
-                    audience.append(mcp_pb2.ROLE_ASSISTANT)
-        proto_annotations = mcp_pb2.Annotations(
-            audience=audience,
-            priority=resource_template.annotations.priority
-            if resource_template.annotations.priority is not None
-            else 0.0,
-        )
-
+    annotations = resource_template.annotations
     return mcp_pb2.ResourceTemplate(
         uri_template=str(resource_template.uriTemplate),
         name=resource_template.name,
         title=resource_template.title,
         description=resource_template.description,
         mime_type=resource_template.mimeType,
-        annotations=proto_annotations,
+        annotations=_annotations_type_to_proto(annotations) if annotations else None,
     )
 
 
@@ -138,18 +178,18 @@ def resource_template_types_to_protos(
 ) -> list[mcp_pb2.ResourceTemplate]:
     """Converts types.ResourceTemplate list to ResourceTemplate proto list."""
     # Keeping selected fields as proto does not have all the fields of
-    # types.ResourceTemplate
-    typed_templates = [
-        types.ResourceTemplate(
-            uriTemplate=t.uriTemplate,
+    # types.ResourceTemplate. The protos are built in one pass rather than by
+    # first re-validating a trimmed copy of every template.
+    return [
+        mcp_pb2.ResourceTemplate(
+            uri_template=str(t.uriTemplate),
             name=t.name,
             title=t.title,
             description=t.description,
-            mimeType=t.mimeType,
+            mime_type=t.mimeType,
         )
         for t in resource_templates
     ]
-    return [resource_template_type_to_proto(resource_template) for resource_template in typed_templates]
 
 
 def resource_template_proto_to_type(
@@ -158,23 +198,14 @@ def resource_template_proto_to_type(
     """Converts a ResourceTemplate protobuf message to a types.ResourceTemplate object."""
     annotations = None
     if resource_template_proto.HasField("annotations"):
-        audience: list[Role] = []
-        for role in resource_template_proto.annotations.audience:
-            if role == mcp_pb2.ROLE_USER:
-                audience.append("user")
-            elif role == mcp_pb2.ROLE_ASSISTANT:
-                audience.append("assistant")
-        annotations = types.Annotations(
-            audience=audience,
-            priority=resource_template_proto.annotations.priority,
-        )
+        annotations = _annotations_proto_to_type(resource_template_proto.annotations)
 
-    return types.ResourceTemplate(
+    return types.ResourceTemplate.model_construct(
         uriTemplate=resource_template_proto.uri_template,
         name=resource_template_proto.name,
         title=resource_template_proto.title,
         description=resource_template_proto.description,
-        mimeType=resource_template_proto.mime_type,
+        mimeType=_mime_type(resource_template_proto.mime_type),
         annotations=annotations,
     )
 
@@ -194,23 +225,46 @@ def read_resource_content_to_proto(
 
     resource_contents: list[mcp_pb2.ResourceContents] = []
     for content_item in contents:
-        resource_content = mcp_pb2.ResourceContents(
-            uri=uri,
-            mime_type=content_item.mime_type,
-        )
-        if isinstance(content_item.content, str):
-            resource_content.text = content_item.content
-        else:  # isinstance(content_item.content, bytes)
-            resource_content.blob = content_item.content
+        content = content_item.content
+        if isinstance(content, str):
+            resource_content = mcp_pb2.ResourceContents(uri=uri, mime_type=content_item.mime_type, text=content)
+        else:  # isinstance(content, bytes)
+            resource_content = mcp_pb2.ResourceContents(uri=uri, mime_type=content_item.mime_type, blob=content)
         resource_contents.append(resource_content)
     return resource_contents
 
 
+def _value_to_python(value: struct_pb2.Value) -> Any:
+    """Converts a Value message to the plain Python value it holds."""
+    kind = value.WhichOneof("kind")
+    if kind == "struct_value":
+        return _struct_to_dict(value.struct_value)
+    if kind == "list_value":
+        return [_value_to_python(item) for item in value.list_value.values]
+    if kind is None or kind == "null_value":
+        return None
+    if kind == "number_value" and not math.isfinite(value.number_value):
+        # JSON has no NaN or Infinity, so such a schema cannot have come from a JSON document.
+        raise json_format.ParseError(f"Invalid non-finite number in Struct: {value.number_value}")
+    return getattr(value, kind)
+
+
+def _struct_to_dict(struct: struct_pb2.Struct) -> dict[str, Any]:
+    """Converts a Struct message to a dict.
+
+    Equivalent to json_format.MessageToDict for Struct, without its generic
+    per-field descriptor dispatch.
+    """
+    return {key: _value_to_python(value) for key, value in struct.fields.items()}
+
+
 def tool_proto_to_type(tool_proto: mcp_pb2.Tool) -> types.Tool:
     """Converts a Tool protobuf message to a types.Tool object."""
     try:
-        input_schema = json_format.MessageToDict(tool_proto.input_schema)
-        output_schema = json_format.MessageToDict(tool_proto.output_schema)
+        # Tools without arguments or structured output are common; skip the
+        # message walk for their empty schemas.
+        input_schema = _struct_to_dict(tool_proto.input_schema) if tool_proto.input_schema.fields else {}
+        output_schema = _struct_to_dict(tool_proto.output_schema) if tool_proto.output_schema.fields else {}
     except json_format.ParseError as e:
         error_message = f"Failed to parse tool schema for {tool_proto.name}: {e}"
         logger.error(error_message, exc_info=True)
@@ -226,34 +280,41 @@ def tool_proto_to_type(tool_proto: mcp_pb2.Tool) -> types.Tool:
 
 def tool_type_to_proto(tool: types.Tool) -> mcp_pb2.Tool:
     """Converts a types.Tool object to a Tool protobuf message."""
-    input_schema_dict = getattr(tool, "inputSchema", {})
-    input_schema = struct_pb2.Struct()
+    # TODO(asheshvidyut): Add annotations once usecase is clear
+    tool_proto = mcp_pb2.Tool(
+        name=tool.name,
+        title=tool.title,
+        description=tool.description,
+    )
+    # Load the schemas straight into the message's own Struct fields rather
+    # than into scratch Structs that then get copied into the constructor.
+    # Struct.update takes a plain dict directly, without the generic
+    # json_format walk; it raises ValueError or TypeError for keys and values
+    # JSON cannot hold.
+    # Both fields are always present on the wire, even when empty.
+    input_schema_dict = tool.inputSchema
     if input_schema_dict:
         try:
-            json_format.ParseDict(input_schema_dict, input_schema)
-        except json_format.ParseError as e:
+            tool_proto.input_schema.update(input_schema_dict)
+        except (ValueError, TypeError) as e:
             error_message = f"Failed to parse inputSchema for tool {tool.name}: {e}"
             logger.error(error_message, exc_info=True)
-            raise e
+            raise json_format.ParseError(str(e)) from e
+    else:
+        tool_proto.input_schema.SetInParent()
 
-    output_schema_dict = getattr(tool, "outputSchema", {})
-    output_schema = struct_pb2.Struct()
+    output_schema_dict = tool.outputSchema
     if output_schema_dict:
         try:
-            json_format.ParseDict(output_schema_dict, output_schema)
-        except json_format.ParseError as e:
+            tool_proto.output_schema.update(output_schema_dict)
+        except (ValueError, TypeError) as e:
             error_message = f"Failed to parse outputSchema for tool {tool.name}: {e}"
             logger.error(error_message, exc_info=True)
-            raise e
+            raise json_format.ParseError(str(e)) from e
+    else:
+        tool_proto.output_schema.SetInParent()
 
-    # TODO(asheshvidyut): Add annotations once usecase is clear
-    return mcp_pb2.Tool(
-        name=tool.name,
-        title=tool.title,
-        description=tool.description,
-        input_schema=input_schema,
-        output_schema=output_schema,
-    )
+    return tool_proto
 
 
 def tool_types_to_protos(tools: list[types.Tool]) -> list[mcp_pb2.Tool]:
@@ -266,37 +327,66 @@ def tool_protos_to_types(tool_protos: list[mcp_pb2.Tool]) -> list[types.Tool]:
     return [tool_proto_to_type(tool_proto) for tool_proto in tool_protos]
 
 
+def _populate_text_content(content_block: types.TextContent, result: mcp_pb2.CallToolResponse.Content) -> bool:
+    result.text.text = content_block.text
+    return True
+
+
+def _populate_image_content(content_block: types.ImageContent, result: mcp_pb2.CallToolResponse.Content) -> bool:
+    result.image.data = binascii.a2b_base64(content_block.data)
+    result.image.mime_type = content_block.mimeType
+    return True
+
+
+def _populate_audio_content(content_block: types.AudioContent, result: mcp_pb2.CallToolResponse.Content) -> bool:
+    result.audio.data = binascii.a2b_base64(content_block.data)
+    result.audio.mime_type = content_block.mimeType
+    return True
+
+
+def _populate_embedded_resource(
+    content_block: types.EmbeddedResource, result: mcp_pb2.CallToolResponse.Content
+) -> bool:
+    resource_contents = content_block.resource
+    result.embedded_resource.contents.uri = str(resource_contents.uri)
+    result.embedded_resource.contents.mime_type = resource_contents.mimeType or ""
+    if isinstance(resource_contents, types.TextResourceContents):
+        result.embedded_resource.contents.text = resource_contents.text
+    else:
+        result.embedded_resource.contents.blob = binascii.a2b_base64(resource_contents.blob)
+    return True
+
+
+def _populate_resource_link(content_block: types.ResourceLink, result: mcp_pb2.CallToolResponse.Content) -> bool:
+    result.resource_link.uri = str(content_block.uri)
+    if content_block.name:
+        result.resource_link.name = content_block.name
+    return True
+
+
+# Keyed by the exact block class so the common case is a single dict lookup
+# instead of an isinstance() cascade.
+_CONTENT_BLOCK_POPULATORS: dict[type[Any], Callable[[Any, mcp_pb2.CallToolResponse.Content], bool]] = {
+    types.TextContent: _populate_text_content,
+    types.ImageContent: _populate_image_content,
+    types.AudioContent: _populate_audio_content,
+    types.EmbeddedResource: _populate_embedded_resource,
+    types.ResourceLink: _populate_resource_link,
+}
+
+
 def _populate_content_from_content_block(
     content_block: types.ContentBlock, result: mcp_pb2.CallToolResponse.Content
 ) -> bool:
     """Populates the result proto from a single content block."""
-    if isinstance(content_block, types.TextContent):
-        result.text.text = content_block.text
-        return True
-    elif isinstance(content_block, types.ImageContent):
-        result.image.data = base64.b64decode(content_block.data)
-        result.image.mime_type = content_block.mimeType
-        return True
-    elif isinstance(content_block, types.AudioContent):
-        result.audio.data = base64.b64decode(content_block.data)
-        result.audio.mime_type = content_block.mimeType
-        return True
-    elif isinstance(content_block, types.EmbeddedResource):
-        resource_contents = content_block.resource
-        result.embedded_resource.contents.uri = str(resource_contents.uri)
-        result.embedded_resource.contents.mime_type = resource_contents.mimeType or ""
-        if isinstance(resource_contents, types.TextResourceContents):
-            result.embedded_resource.contents.text = resource_contents.text
-            return True
-        elif isinstance(resource_contents, types.BlobResourceContents):  # type: ignore
-            result.embedded_resource.contents.blob = base64.b64decode(resource_contents.blob)
-            return True
-    elif isinstance(content_block, types.ResourceLink):  # type: ignore
-        result.resource_link.uri = str(content_block.uri)
-        if content_block.name:
-            result.resource_link.name = content_block.name
-        return True
-    return False
+    populate = _CONTENT_BLOCK_POPULATORS.get(type(content_block))
+    if populate is None:
+        # Subclasses of the content block types miss the exact-type lookup.
+        for block_type, block_populate in _CONTENT_BLOCK_POPULATORS.items():
+            if isinstance(content_block, block_type):
+                return block_populate(content_block, result)
+        return False
+    return populate(content_block, result)
 
 
 def unstructured_tool_output_to_proto(
@@ -319,6 +409,68 @@ def unstructured_tool_output_to_proto(
     return contents
 
 
+def _text_content_from_proto(proto_result: mcp_pb2.CallToolResponse.Content) -> types.ContentBlock | None:
+    return types.TextContent.model_construct(type="text", text=proto_result.text.text)
+
+
+def _image_content_from_proto(proto_result: mcp_pb2.CallToolResponse.Content) -> types.ContentBlock | None:
+    return types.ImageContent.model_construct(
+        type="image",
+        data=binascii.b2a_base64(proto_result.image.data, newline=False).decode("ascii"),
+        mimeType=_mime_type(proto_result.image.mime_type),
+    )
+
+
+def _audio_content_from_proto(proto_result: mcp_pb2.CallToolResponse.Content) -> types.ContentBlock | None:
+    return types.AudioContent.model_construct(
+        type="audio",
+        data=binascii.b2a_base64(proto_result.audio.data, newline=False).decode("ascii"),
+        mimeType=_mime_type(proto_result.audio.mime_type),
+    )
+
+
+def _embedded_resource_from_proto(proto_result: mcp_pb2.CallToolResponse.Content) -> types.ContentBlock | None:
+    resource_contents = proto_result.embedded_resource.contents
+    res_content = None
+    if resource_contents.text:
+        res_content = types.TextResourceContents.model_construct(
+            uri=_any_url(resource_contents.uri),
+            mimeType=_mime_type(resource_contents.mime_type),
+            text=resource_contents.text,
+        )
+    elif resource_contents.blob:
+        res_content = types.BlobResourceContents.model_construct(
+            uri=_any_url(resource_contents.uri),
+            mimeType=_mime_type(resource_contents.mime_type),
+            blob=binascii.b2a_base64(resource_contents.blob, newline=False).decode("ascii"),
+        )
+    if res_content:
+        return types.EmbeddedResource.model_construct(type="resource", resource=res_content)
+    return None
+
+
+def _resource_link_from_proto(proto_result: mcp_pb2.CallToolResponse.Content) -> types.ContentBlock | None:
+    return types.ResourceLink.model_construct(
+        name=proto_result.resource_link.name,
+        type="resource_link",
+        uri=_any_url(proto_result.resource_link.uri),
+    )
+
+
+# Keyed by CallToolResponse.Content field name. The content fields are not
+# declared as a oneof, so the set field is found with ListFields(), which
+# returns fields in field-number order, i.e. the same precedence the
+# HasField() cascade used. Fields missing from the table (e.g. content types
+# added to the proto later) are skipped.
+_CONTENT_FROM_PROTO: dict[str, Callable[[mcp_pb2.CallToolResponse.Content], types.ContentBlock | None]] = {
+    "text": _text_content_from_proto,
+    "image": _image_content_from_proto,
+    "audio": _audio_content_from_proto,
+    "embedded_resource": _embedded_resource_from_proto,
+    "resource_link": _resource_link_from_proto,
+}
+
+
 def proto_result_to_content(
     proto_results: list[mcp_pb2.CallToolResponse.Content],
     structured_content: dict[str, Any] | None = None,
@@ -327,50 +479,17 @@ def proto_result_to_content(
     """Converts a CallToolResponse.Content proto to a types.CallToolResult."""
     content: list[types.ContentBlock] = []
     for proto_result in proto_results:
-        if proto_result.HasField("text"):
-            content.append(types.TextContent(type="text", text=proto_result.text.text))
-        elif proto_result.HasField("image"):
-            content.append(
-                types.ImageContent(
-                    type="image",
-                    data=base64.b64encode(proto_result.image.data).decode("utf-8"),
-                    mimeType=proto_result.image.mime_type,
-                )
-            )
-        elif proto_result.HasField("audio"):
-            content.append(
-                types.AudioContent(
-                    type="audio",
-                    data=base64.b64encode(proto_result.audio.data).decode("utf-8"),
-                    mimeType=proto_result.audio.mime_type,
-                )
-            )
-        elif proto_result.HasField("embedded_resource"):
-            resource_contents = proto_result.embedded_resource.contents
-            res_content = None
-            if resource_contents.text:
-                res_content = types.TextResourceContents(
-                    uri=AnyUrl(resource_contents.uri),
-                    mimeType=resource_contents.mime_type,
-                    text=resource_contents.text,
-                )
-            elif resource_contents.blob:
-                res_content = types.BlobResourceContents(
-                    uri=AnyUrl(resource_contents.uri),
-                    mimeType=resource_contents.mime_type,
-                    blob=base64.b64encode(resource_contents.blob).decode("utf-8"),
-                )
-            if res_content:
-                content.append(types.EmbeddedResource(type="resource", resource=res_content))
-        elif proto_result.HasField("resource_link"):
-            content.append(
-                types.ResourceLink(
-                    name=proto_result.resource_link.name,
-                    type="resource_link",
-                    uri=AnyUrl(proto_result.resource_link.uri),
-                )
-            )
-    return types.CallToolResult(
+        from_proto = None
+        for field, _ in proto_result.ListFields():
+            from_proto = _CONTENT_FROM_PROTO.get(field.name)
+            if from_proto is not None:
+                break
+        if from_proto is None:
+            continue
+        block = from_proto(proto_result)
+        if block is not None:
+            content.append(block)
+    return types.CallToolResult.model_construct(
         content=content,
         structuredContent=structured_content,
         isError=is_error,
@@ -387,6 +506,19 @@ class ToolOutputValidationError(Exception):
     """Exception raised for tool output validation errors."""
 
 
+@functools.lru_cache(maxsize=256)
+def _output_schema_validator(schema_json: str) -> Validator:
+    """Returns a checked validator for an output schema, keyed by its canonical JSON.
+
+    jsonschema.validate() re-checks the schema and builds a new validator on every
+    call; a tool's output schema does not change between calls.
+    """
+    schema = json.loads(schema_json)
+    validator_cls: type[Validator] = validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
 def normalize_and_validate_tool_results(
     results: ToolResult, tool: types.Tool | None
 ) -> tuple[Sequence[types.ContentBlock] | None, StructuredContent | None]:
@@ -414,14 +546,35 @@ def normalize_and_validate_tool_results(
                 "Output validation error: outputSchema defined but no structured output returned"
             )
         else:
-            try:
-                jsonschema.validate(instance=maybe_structured_content, schema=tool.outputSchema)
-            except jsonschema.ValidationError as e:
-                raise ToolOutputValidationError(f"Output validation error: {e.message}") from e
+            validator = _output_schema_validator(json.dumps(tool.outputSchema, sort_keys=True))
+            # The jsonschema stubs leave best_match's return type unknown; it is the
+            # most relevant error, if any.
+            error = cast(ValidationError | None, best_match(validator.iter_errors(maybe_structured_content)))
+            if error is not None:
+                raise ToolOutputValidationError(f"Output validation error: {error.message}") from error
 
     return (list(unstructured_content) if unstructured_content else None), maybe_structured_content
 
 
+def progress_notification_to_proto(
+    progress_token: str | int,
+    progress: float,
+    total: float | None = None,
+    message: str | None = None,
+) -> mcp_pb2.CallToolResponse:
+    """Converts a progress notification to a CallToolResponse proto."""
+    response = mcp_pb2.CallToolResponse()
+    # Fill the nested message in place; building it standalone copies it into each parent in turn.
+    progress_proto = response.common.progress
+    progress_proto.progress_token = str(progress_token)
+    progress_proto.progress = progress
+    if total is not None:
+        progress_proto.total = total
+    if message is not None:
+        progress_proto.message = message
+    return response
+
+
 def call_tool_request_params_to_proto(
     request_params: types.CallToolRequestParams,
 ) -> mcp_pb2.CallToolRequest:
@@ -437,15 +590,14 @@ def call_tool_request_params_to_proto(
             name,
         )
         request.common.progress.progress_token = str(meta.progressToken)
-    args_struct = None
+    request.request.name = name
     if arguments:
+        # Fill the request's own Struct in place; there is no scratch Struct
+        # to build and then deep-copy.
         try:
-            args_struct = json_format.ParseDict(arguments, struct_pb2.Struct())
-        except json_format.ParseError as e:
+            request.request.arguments.update(arguments)
+        except (ValueError, TypeError) as e:
             error_message = f'Failed to parse tool arguments for "{name}": {e}'
             logger.error(error_message, exc_info=True)
             raise McpError(ErrorData(code=types.PARSE_ERROR, message=error_message)) from e
-    request.request.name = name
-    if args_struct:
-        request.request.arguments.CopyFrom(args_struct)
     return request
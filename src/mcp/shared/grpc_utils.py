@@ -20,18 +20,14 @@ F = TypeVar("F", bound=Callable[..., Any])
 
 def check_protocol_version_from_metadata(func: F) -> F:
     """Decorator to check protocol version from metadata for gRPC methods.
-    It aborts the RPC if the protocol version is not provided or is not supported.
+    It aborts the RPC if the protocol version is not provided or is not supported,
+    so the version it echoes back in the initial metadata needs no further check.
     """
 
     @functools.wraps(func)
     async def async_wrapper(self: Any, request: Any, context: aio.ServicerContext[Any, Any], *args: Any, **kwargs: Any):
         protocol_version_str = await get_protocol_version_from_context(context, version.SUPPORTED_PROTOCOL_VERSIONS)
-        if protocol_version_str in version.SUPPORTED_PROTOCOL_VERSIONS:
-            await context.send_initial_metadata(
-                [
-                    (MCP_PROTOCOL_VERSION_KEY, protocol_version_str),
-                ]
-            )
+        await context.send_initial_metadata([(MCP_PROTOCOL_VERSION_KEY, protocol_version_str)])
         return await func(self, request, context, *args, **kwargs)
 
     @functools.wraps(func)
@@ -39,12 +35,7 @@ def check_protocol_version_from_metadata(func: F) -> F:
         self: Any, request: Any, context: aio.ServicerContext[Any, Any], *args: Any, **kwargs: Any
     ):
         protocol_version_str = await get_protocol_version_from_context(context, version.SUPPORTED_PROTOCOL_VERSIONS)
-        if protocol_version_str in version.SUPPORTED_PROTOCOL_VERSIONS:
-            await context.send_initial_metadata(
-                [
-                    (MCP_PROTOCOL_VERSION_KEY, protocol_version_str),
-                ]
-            )
+        await context.send_initial_metadata([(MCP_PROTOCOL_VERSION_KEY, protocol_version_str)])
         async for item in func(self, request, context, *args, **kwargs):
             yield item
 
@@ -82,8 +73,11 @@ async def get_protocol_version_from_context(
 def get_metadata_value(metadata: grpc.aio.Metadata | None, key: str) -> str | None:
     """Extracts a value from gRPC metadata by key."""
     if metadata:
+        # gRPC delivers metadata keys lowercased, so lower the lookup key once
+        # and only fall back to lowering an entry's key when it differs.
+        lower_key = key.lower()
         for k, value in metadata:
-            if k.lower() == key.lower():
+            if k == lower_key or k.lower() == lower_key:
                 if isinstance(value, bytes):
                     return value.decode("utf-8")
                 return str(value)
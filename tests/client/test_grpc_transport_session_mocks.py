@@ -1,4 +1,5 @@
 import asyncio
+import os
 
 # Fixtures from test_grpc_transport_session.py
 import socket
@@ -11,6 +12,8 @@ from unittest import mock
 import grpc
 import grpc.aio as aio
 import pytest
+
+from google.protobuf import struct_pb2  # isort: skip
 from pydantic import AnyUrl
 
 from mcp import types
@@ -22,6 +25,9 @@ from mcp.server.grpc import create_mcp_grpc_server
 from mcp.shared import version
 from mcp.shared.exceptions import McpError
 
+# Metadata the transport sends before any version negotiation; a list, to match what it passes to the stub.
+_LATEST_MD = [("mcp-protocol-version", version.LATEST_PROTOCOL_VERSION)]
+
 
 def setup_test_server(port: int) -> FastMCP:
     """Set up a minimal FastMCP server for testing mocks."""
@@ -34,7 +40,7 @@ def setup_test_server(port: int) -> FastMCP:
     return mcp
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def server_port() -> int:
     """Find an available port for the server."""
     with socket.socket() as s:
@@ -42,9 +48,12 @@ def server_port() -> int:
         return s.getsockname()[1]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 async def grpc_server(server_port: int) -> AsyncGenerator[aio.Server | Any, Any]:
-    """Start a gRPC server in process."""
+    """Start a gRPC server in process, shared by every test in the module.
+
+    The tests only mock the client stub, so nothing they do changes server state.
+    """
     server_instance = setup_test_server(server_port)
     server = await create_mcp_grpc_server(target=f"127.0.0.1:{server_port}", mcp_server=server_instance)
 
@@ -60,11 +69,8 @@ def _create_mock_tool_proto(name: str):
     mock_tool_proto = mock.MagicMock()
     mock_tool_proto.name = name
     mock_tool_proto.description = f"A {name} tool"
-    mock_descriptor = mock.Mock()
-    mock_descriptor.full_name = "mock_input_schema"
-    mock_input_schema = mock.Mock(DESCRIPTOR=mock_descriptor)
-    mock_input_schema.ListFields.return_value = []
-    mock_tool_proto.input_schema = mock_input_schema
+    mock_tool_proto.input_schema = struct_pb2.Struct()
+    mock_tool_proto.output_schema = struct_pb2.Struct()
     return mock_tool_proto
 
 
@@ -169,9 +175,7 @@ async def test_list_resources_honors_session_timeout(grpc_server: None, server_p
     transport.grpc_stub.ListResources = list_resources_mock
     try:
         await transport.list_resources()
-        list_resources_mock.assert_called_once_with(
-            mock.ANY, timeout=5.0, metadata=[("mcp-protocol-version", version.LATEST_PROTOCOL_VERSION)]
-        )
+        list_resources_mock.assert_called_once_with(mock.ANY, timeout=5.0, metadata=_LATEST_MD)
     finally:
         await transport.close()
 
@@ -187,9 +191,7 @@ async def test_list_tools_honors_session_timeout(grpc_server: None, server_port:
     transport.grpc_stub.ListTools = list_tool_mock
     try:
         await transport.list_tools()
-        list_tool_mock.assert_called_once_with(
-            mock.ANY, timeout=5.0, metadata=[("mcp-protocol-version", version.LATEST_PROTOCOL_VERSION)]
-        )
+        list_tool_mock.assert_called_once_with(mock.ANY, timeout=5.0, metadata=_LATEST_MD)
     finally:
         await transport.close()
 
@@ -207,9 +209,7 @@ async def test_list_resource_templates_honors_session_timeout(grpc_server: None,
     transport.grpc_stub.ListResourceTemplates = list_templates_mock
     try:
         await transport.list_resource_templates()
-        list_templates_mock.assert_called_once_with(
-            mock.ANY, timeout=5.0, metadata=[("mcp-protocol-version", version.LATEST_PROTOCOL_VERSION)]
-        )
+        list_templates_mock.assert_called_once_with(mock.ANY, timeout=5.0, metadata=_LATEST_MD)
     finally:
         await transport.close()
 
@@ -713,8 +713,15 @@ async def mock_call_tool_generator(responses):
 
 @pytest.fixture
 def mock_grpc_stub(monkeypatch):
-    """Fixture to mock the gRPC stub."""
-    mock_stub = unittest.mock.Mock()
+    """Fixture to mock the gRPC stub.
+
+    The stub is spec'd against `McpStub` and its RPC attributes are created up front, so tests
+    only configure `return_value`/`side_effect` instead of replacing the attributes.
+    """
+    mock_stub = unittest.mock.Mock(spec=mcp_pb2_grpc.McpStub)
+    mock_stub.CallTool = unittest.mock.Mock()
+    mock_stub.ListTools = unittest.mock.AsyncMock(return_value=mcp_pb2.ListToolsResponse())
+    mock_stub.ReadResource = unittest.mock.AsyncMock(return_value=mcp_pb2.ReadResourceResponse())
     monkeypatch.setattr(mcp_pb2_grpc, "McpStub", unittest.mock.Mock(return_value=mock_stub))
     return mock_stub
 
@@ -751,19 +758,17 @@ async def test_call_tool_version_mismatch_retry_success(mock_grpc_stub, monkeypa
 
     mock_grpc_stub.CallTool.side_effect = call_tool_side_effect
 
-    # Mock ListTools for the validation step
-    mock_grpc_stub.ListTools = unittest.mock.AsyncMock(return_value=mcp_pb2.ListToolsResponse())
-
     # Execute CallTool
     result = await session.call_tool("test_tool", {"arg": "value"})
 
-    # Assertions
-    assert session.negotiated_version == "v2"  # Version should be updated
-    assert mock_grpc_stub.CallTool.call_count == 2
-    assert result.isError is False
-    assert result.content[0].text == "Success"
-    assert mock_grpc_stub.ListTools.called  # Ensure list_tools was called for validation
-    assert mock_grpc_stub.ListTools.call_count == 1
+    # Version is updated, CallTool is retried once and ListTools is called once for validation
+    assert (
+        session.negotiated_version,
+        result.isError,
+        result.content[0].text,
+        mock_grpc_stub.CallTool.call_count,
+        mock_grpc_stub.ListTools.call_count,
+    ) == ("v2", False, "Success", 2, 1)
 
 
 @pytest.mark.anyio
@@ -784,19 +789,21 @@ async def test_call_tool_version_mismatch_retry_failure(mock_grpc_stub, monkeypa
     with pytest.raises(McpError) as excinfo:
         await session.call_tool("test_tool", {"arg": "value"})
 
-    # Assertions
-    assert session.negotiated_version == "v1"  # Version should NOT be updated
-    assert mock_grpc_stub.CallTool.call_count == 1  # Only one call made
+    # Version is NOT updated and only one call is made
     _args, kwargs = mock_grpc_stub.CallTool.call_args
-    metadata = kwargs.get("metadata")
-    assert metadata is not None
-    assert ("mcp-tool-name", "test_tool") in metadata
-    assert ("mcp-protocol-version", "v1") in metadata
     assert (
-        excinfo.value.error.message
-        == 'grpc.RpcError - Failed to call tool "test_tool": Unsupported protocol version: v1'
+        session.negotiated_version,
+        mock_grpc_stub.CallTool.call_count,
+        kwargs.get("metadata"),
+        excinfo.value.error.code,
+        excinfo.value.error.message,
+    ) == (
+        "v1",
+        1,
+        [("mcp-tool-name", "test_tool"), ("mcp-protocol-version", "v1")],
+        types.INTERNAL_ERROR,
+        'grpc.RpcError - Failed to call tool "test_tool": Unsupported protocol version: v1',
     )
-    assert excinfo.value.error.code == -32603  # INTERNAL_ERROR
 
 
 @pytest.mark.anyio
@@ -807,13 +814,9 @@ async def test_call_tool_sends_tool_name_in_metadata(mock_grpc_stub, server_port
 
     # Mock CallTool to return a successful async generator and capture metadata
     mock_grpc_stub.CallTool.return_value = mock_call_tool_generator([mcp_pb2.CallToolResponse()])
-    mock_grpc_stub.ListTools = unittest.mock.AsyncMock(return_value=mcp_pb2.ListToolsResponse())
 
     # Execute CallTool
-    try:
-        await session.call_tool(tool_name, {"arg": "value"})
-    except McpError:
-        pytest.fail("CallTool raised an unexpected McpError")
+    await session.call_tool(tool_name, {"arg": "value"})
 
     # Assertions
     mock_grpc_stub.CallTool.assert_called_once()
@@ -831,14 +834,8 @@ async def test_read_resource_sends_resource_uri_in_metadata(mock_grpc_stub, serv
     session = GRPCTransportSession(target=f"127.0.0.1:{server_port}")
     resource_uri = "test://some/resource"
 
-    # Mock ReadResource to return a successful response and capture metadata
-    mock_grpc_stub.ReadResource = unittest.mock.AsyncMock(return_value=mcp_pb2.ReadResourceResponse())
-
     # Execute ReadResource
-    try:
-        await session.read_resource(AnyUrl(resource_uri))
-    except McpError:
-        pytest.fail("ReadResource raised an unexpected McpError")
+    await session.read_resource(AnyUrl(resource_uri))
 
     # Assertions
     mock_grpc_stub.ReadResource.assert_called_once()
@@ -858,33 +855,45 @@ async def test_call_unary_rpc_metadata_update_on_retry(mock_grpc_stub, monkeypat
     session.negotiated_version = "v1"
     monkeypatch.setattr(version, "SUPPORTED_PROTOCOL_VERSIONS", [initial_version, new_version])
 
-    mock_rpc_method = mock.AsyncMock()
     # First call: Raise UNIMPLEMENTED with new_version in metadata
     e = grpc.RpcError()
     e.code = lambda: grpc.StatusCode.UNIMPLEMENTED
     e.details = lambda: "Unsupported protocol version: v1"
     e.initial_metadata = lambda: [("mcp-protocol-version", new_version)]
-    # Second call: Successful response
-    mock_rpc_method.side_effect = [e, mock.MagicMock()]
+    errors = iter([e])
+    calls: list[tuple[tuple[str, str], ...]] = []
+
+    async def rpc_method(request, *, timeout, metadata):
+        calls.append(tuple(metadata))
+        for error in errors:
+            raise error
+        # Second call: Successful response
+        return mcp_pb2.ListToolsResponse()
 
-    # We need a dummy request and timeout
-    dummy_request = mcp_pb2.ListToolsRequest()
-    dummy_timeout = 5.0
-    initial_metadata = []
+    rpc_method._method = b"/mcp.Mcp/ListTools"
 
-    # Call _call_unary_rpc
-    await session._call_unary_rpc(mock_rpc_method, dummy_request, dummy_timeout, metadata=initial_metadata)
+    # Call _call_unary_rpc with a dummy request and timeout
+    await session._call_unary_rpc(rpc_method, mcp_pb2.ListToolsRequest(), 5.0, metadata=[])
 
     # Assertions
-    assert mock_rpc_method.call_count == 2
-    # Check metadata in the first call
-    _, kwargs1 = mock_rpc_method.call_args_list[0]
-    metadata1 = kwargs1.get("metadata")
-    assert metadata1 is not None
-    assert ("mcp-protocol-version", initial_version) in metadata1
-
-    # Check metadata in the second call
-    _, kwargs2 = mock_rpc_method.call_args_list[1]
-    metadata2 = kwargs2.get("metadata")
-    assert metadata2 is not None
-    assert ("mcp-protocol-version", new_version) in metadata2
+    assert calls == [
+        (("mcp-protocol-version", initial_version),),
+        (("mcp-protocol-version", new_version),),
+    ]
+
+
+@pytest.mark.anyio
+@pytest.mark.skipif(not os.getenv("RUN_BENCH"), reason="Set RUN_BENCH=1 to run the bulk CallTool benchmark")
+async def test_call_tool_bulk(mock_grpc_stub, server_port):  # pragma: no cover
+    """Drive many concurrent CallTool invocations through one session and one mocked stub."""
+    session = GRPCTransportSession(target=f"127.0.0.1:{server_port}")
+    response = mcp_pb2.CallToolResponse()
+    response.content.add().text.text = "Success"
+    mock_grpc_stub.CallTool.side_effect = lambda *args, **kwargs: MockAsyncStream([response])
+    try:
+        results = await asyncio.gather(*[session.call_tool("test_tool", {"arg": "value"}) for _ in range(1000)])
+    finally:
+        await session.close()
+
+    assert [result.content[0].text for result in results] == ["Success"] * 1000
+    assert mock_grpc_stub.CallTool.call_count == 1000
@@ -1,9 +1,13 @@
 import asyncio
 import json
-import socket
+import shutil
+import sys
+import tempfile
 import unittest.mock
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator, Awaitable, Mapping
+from contextlib import asynccontextmanager
 from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, Protocol, cast
 
 import grpc
@@ -15,8 +19,9 @@ from pydantic import BaseModel
 
 from mcp.proto import mcp_pb2, mcp_pb2_grpc
 from mcp.server.fastmcp.server import FastMCP
-from mcp.server.grpc import create_mcp_grpc_server
+from mcp.server.grpc import attach_mcp_server_to_grpc_server
 from mcp.shared import version
+from tests.test_helpers import GRPC_KEEPALIVE_CHANNEL_OPTIONS, GRPC_KEEPALIVE_SERVER_OPTIONS
 
 if TYPE_CHECKING:
 
@@ -35,13 +40,230 @@ if TYPE_CHECKING:
         Complete: grpc.aio.UnaryUnaryMultiCallable[mcp_pb2.CompletionRequest, mcp_pb2.CompletionResponse]
 
 
-def setup_test_server(port: int, test_dir: Path) -> FastMCP:
+# Built once: protobuf messages and metadata are not mutated when sent, so tests can share them.
+# The value is pre-encoded so grpc.aio does not re-encode the string on every call.
+_LATEST_MD = (("mcp-protocol-version", version.LATEST_PROTOCOL_VERSION.encode("ascii")),)
+_EMPTY_COMMON = mcp_pb2.RequestFields()
+# The shared channel carries concurrent RPCs from several tests; lift the receive limit, keep the
+# connection alive between tests with keepalive pings and keep its subchannel out of the global pool.
+_CHANNEL_OPTIONS = [
+    ("grpc.max_receive_message_length", -1),
+    *GRPC_KEEPALIVE_CHANNEL_OPTIONS,
+    ("grpc.use_local_subchannel_pool", 1),
+]
+_LIST_TOOLS_REQ = mcp_pb2.ListToolsRequest(common=_EMPTY_COMMON)
+_LIST_RES_REQ = mcp_pb2.ListResourcesRequest(common=_EMPTY_COMMON)
+_LIST_TPL_REQ = mcp_pb2.ListResourceTemplatesRequest(common=_EMPTY_COMMON)
+_REQ_READ_DATA = mcp_pb2.ReadResourceRequest(common=_EMPTY_COMMON, uri="test://data")
+_REQ_READ_BINARY = mcp_pb2.ReadResourceRequest(common=_EMPTY_COMMON, uri="test://binary_resource")
+_REQ_READ_EXAMPLE_PY = mcp_pb2.ReadResourceRequest(common=_EMPTY_COMMON, uri="file://test_dir/example.py")
+_CALL_TOOL_REQUESTS: dict[tuple[str, frozenset[tuple[str, Any]]], mcp_pb2.CallToolRequest] = {}
+
+
+def _make_call_tool_request(tool_name: str, arguments: dict[str, Any]) -> mcp_pb2.CallToolRequest:
+    """Return a CallToolRequest for `tool_name`, built once per distinct set of arguments."""
+    key = (tool_name, frozenset(arguments.items()))
+    if (request := _CALL_TOOL_REQUESTS.get(key)) is None:
+        request = mcp_pb2.CallToolRequest(common=_EMPTY_COMMON, request=mcp_pb2.CallToolRequest.Request(name=tool_name))
+        request.request.arguments.update(arguments)
+        _CALL_TOOL_REQUESTS[key] = request
+    return request
+
+
+_GREET_REQUEST = _make_call_tool_request("greet", {"name": "Test"})
+# A CallToolRequest without its inner request, which the server rejects.
+_EMPTY_REQUEST = mcp_pb2.CallToolRequest(common=_EMPTY_COMMON)
+# JSON text content returned by dict_tool and structured_dict_tool, compared after parsing.
+_EXPECTED_DICT = {"key": "value"}
+
+
+class DictOutput(BaseModel):
+    key: str
+
+
+_EXPECTED_TOOLS: Mapping[str, Any] = MappingProxyType(
+    {
+        "greet": {
+            "name": "greet",
+            "description": "A simple greeting tool.",
+            "inputSchema": {
+                "properties": {"name": {"title": "Name", "type": "string"}},
+                "required": ["name"],
+                "title": "greetArguments",
+                "type": "object",
+            },
+            "outputSchema": {
+                "properties": {"result": {"title": "Result", "type": "string"}},
+                "required": ["result"],
+                "title": "greetOutput",
+                "type": "object",
+            },
+        },
+        "test_tool": {
+            "name": "test_tool",
+            "description": "A test tool that adds two numbers.",
+            "inputSchema": {
+                "properties": {
+                    "a": {"title": "A", "type": "integer"},
+                    "b": {"title": "B", "type": "integer"},
+                },
+                "required": ["a", "b"],
+                "title": "test_toolArguments",
+                "type": "object",
+            },
+            "outputSchema": {
+                "properties": {"result": {"title": "Result", "type": "integer"}},
+                "required": ["result"],
+                "title": "test_toolOutput",
+                "type": "object",
+            },
+        },
+        "failing_tool": {
+            "name": "failing_tool",
+            "description": "A tool that always fails.",
+            "inputSchema": {
+                "properties": {},
+                "title": "failing_toolArguments",
+                "type": "object",
+            },
+            "outputSchema": {
+                "properties": {"result": {"title": "Result", "type": "string"}},
+                "required": ["result"],
+                "title": "failing_toolOutput",
+                "type": "object",
+            },
+        },
+        "list_tool": {
+            "name": "list_tool",
+            "description": "A tool that returns a list of strings.",
+            "inputSchema": {
+                "properties": {},
+                "title": "list_toolArguments",
+                "type": "object",
+            },
+            "outputSchema": {
+                "properties": {
+                    "result": {
+                        "items": {"type": "string"},
+                        "title": "Result",
+                        "type": "array",
+                    }
+                },
+                "required": ["result"],
+                "title": "list_toolOutput",
+                "type": "object",
+            },
+        },
+        "dict_tool": {
+            "name": "dict_tool",
+            "description": "A tool that returns a dict.",
+            "inputSchema": {
+                "properties": {},
+                "title": "dict_toolArguments",
+                "type": "object",
+            },
+            "outputSchema": {},
+        },
+        "structured_dict_tool": {
+            "name": "structured_dict_tool",
+            "description": "A tool that returns a dict via pydantic model.",
+            "inputSchema": {
+                "properties": {},
+                "title": "structured_dict_toolArguments",
+                "type": "object",
+            },
+            "outputSchema": {
+                "properties": {"key": {"title": "Key", "type": "string"}},
+                "required": ["key"],
+                "title": "DictOutput",
+                "type": "object",
+            },
+        },
+    }
+)
+
+
+def _to_struct(value: dict[str, Any]) -> struct_pb2.Struct:
+    """Build a Struct with Struct.update, which skips ParseDict's reflective field walk."""
+    struct = struct_pb2.Struct()
+    struct.update(value)
+    return struct
+
+
+# Expected schemas as Structs, so responses are compared message-to-message without MessageToDict.
+_EXPECTED_TOOL_SCHEMAS = {
+    name: (_to_struct(tool["inputSchema"]), _to_struct(tool["outputSchema"])) for name, tool in _EXPECTED_TOOLS.items()
+}
+
+
+async def _drain(call: AsyncIterable[Any]) -> list[Any]:
+    """Collect every response of a server-streaming call."""
+    return [response async for response in call]
+
+
+async def _assert_rpc_error(call: Awaitable[Any], code: grpc.StatusCode, details: str = "") -> grpc.aio.AioRpcError:
+    """Await an RPC, assert it fails with `code` and `details`, and return the error."""
+    with pytest.raises(grpc.aio.AioRpcError) as excinfo:
+        await call
+    assert excinfo.value.code() == code
+    assert details in (excinfo.value.details() or "")
+    return excinfo.value
+
+
+# RPCs whose protocol-version negotiation is exercised, with the request each one sends.
+_VERSIONED_RPC_REQUESTS: dict[str, Any] = {"ListTools": _LIST_TOOLS_REQ, "CallTool": _GREET_REQUEST}
+
+
+def _start_rpc(
+    stub: "McpAsyncStub", rpc: str, metadata: tuple[tuple[str, str], ...] | None
+) -> grpc.aio.UnaryUnaryCall[Any, Any] | grpc.aio.UnaryStreamCall[Any, Any]:
+    """Start one of the versioned RPCs without waiting for its result."""
+    return getattr(stub, rpc)(_VERSIONED_RPC_REQUESTS[rpc], metadata=metadata)
+
+
+async def _responses(call: grpc.aio.UnaryUnaryCall[Any, Any] | grpc.aio.UnaryStreamCall[Any, Any]) -> list[Any]:
+    """Collect the responses of a unary or server-streaming call."""
+    if isinstance(call, grpc.aio.UnaryStreamCall):
+        return await _drain(call)
+    return [await call]
+
+
+@asynccontextmanager
+async def _serve(mcp_server: FastMCP) -> AsyncIterator[str]:
+    """Run an in-process gRPC server for `mcp_server` and yield the target to connect to."""
+    server = grpc.aio.server(options=GRPC_KEEPALIVE_SERVER_OPTIONS)
+    attach_mcp_server_to_grpc_server(mcp_server, server)
+    socket_dir = None
+    if sys.platform == "win32":  # pragma: no cover
+        # Binding port 0 lets the OS pick a free port, with no probe-then-bind race.
+        target = f"127.0.0.1:{server.add_insecure_port('127.0.0.1:0')}"
+    else:
+        # A Unix domain socket skips the loopback TCP stack. mkdtemp gives a short path, unique per server,
+        # that stays under the ~108-byte sun_path limit; the pytest basetemp can be too deep for it.
+        socket_dir = tempfile.mkdtemp(prefix="mcp-grpc-")
+        target = f"unix:{Path(socket_dir) / 'mcp.sock'}"
+        server.add_insecure_port(target)
+    await server.start()
+    try:
+        yield target
+    finally:
+        await server.stop(None)
+        if socket_dir is not None:
+            shutil.rmtree(socket_dir, ignore_errors=True)
+
+
+@asynccontextmanager
+async def _connect(target: str) -> AsyncIterator["McpAsyncStub"]:
+    """Open a channel to the server at `target` and yield a stub for it."""
+    async with grpc.aio.insecure_channel(target, options=_CHANNEL_OPTIONS) as channel:
+        yield cast("McpAsyncStub", mcp_pb2_grpc.McpStub(channel))
+
+
+def setup_test_server(test_dir: Path) -> FastMCP:
     """Set up a FastMCP server for testing."""
     mcp = FastMCP(
         name="Test gRPC Server",
         instructions="A test MCP server for gRPC transport.",
-        host="127.0.0.1",
-        port=port,
     )
 
     @mcp.resource("test://data")
@@ -123,212 +345,95 @@ def setup_test_server(port: int, test_dir: Path) -> FastMCP:
         """A tool that returns a dict."""
         return {"key": "value"}  # type: ignore
 
-    class DictOutput(BaseModel):
-        key: str
-
     @mcp.tool()
     def structured_dict_tool() -> DictOutput:
         """A tool that returns a dict via pydantic model."""
         return DictOutput(key="value")
 
-    @mcp.tool()
-    async def blocking_tool():
-        """A tool that blocks until cancelled."""
-        try:
-            await asyncio.sleep(10)
-        except asyncio.CancelledError:
-            raise
-
     return mcp
 
 
-@pytest.fixture
-def server_port() -> int:
-    """Find an available port for the server."""
-    with socket.socket() as s:
-        s.bind(("127.0.0.1", 0))
-        return s.getsockname()[1]
-
-
-@pytest.fixture
-async def grpc_server(server_port: int, tmp_path: Path) -> AsyncGenerator[None, None]:
-    """Start a gRPC server in process."""
-    test_dir = tmp_path / "test_dir"
-    test_dir.mkdir()
+@pytest.fixture(scope="session")
+def test_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the files served by the file:// resources once per session."""
+    test_dir = tmp_path_factory.mktemp("test_dir")
     (test_dir / "example.py").write_text("print('hello')")
     (test_dir / "readme.md").write_text("# Test Readme")
     (test_dir / "config.json").write_text('{"test": "value"}')
-    server_instance = setup_test_server(server_port, test_dir)
-    server = await create_mcp_grpc_server(target=f"127.0.0.1:{server_port}", mcp_server=server_instance)
+    return test_dir
 
-    yield
-    await server.stop(None)
 
+@pytest.fixture(scope="module")
+def mcp_server(test_dir: Path) -> FastMCP:
+    """Build the FastMCP test server once so tool and resource registration runs once per module."""
+    return setup_test_server(test_dir)
 
-@pytest.fixture
-async def grpc_stub(server_port: int) -> AsyncGenerator["McpAsyncStub", None]:
-    """Create a gRPC client stub."""
-    async with grpc.aio.insecure_channel(f"127.0.0.1:{server_port}") as channel:
-        stub = mcp_pb2_grpc.McpStub(channel)
-        yield cast("McpAsyncStub", stub)
 
+@pytest.fixture(scope="module")
+async def grpc_server(mcp_server: FastMCP) -> AsyncGenerator[str, None]:
+    """Start a gRPC server in process, shared by every test in the module, and yield its target."""
+    async with _serve(mcp_server) as target:
+        yield target
 
-@pytest.mark.anyio
-@pytest.mark.parametrize("protocol_version", version.SUPPORTED_PROTOCOL_VERSIONS)
-async def test_protocol_version_supported(grpc_server: None, grpc_stub: "McpAsyncStub", protocol_version: str):
-    """Test RPCs with a supported protocol version in metadata."""
-    metadata = (("mcp-protocol-version", protocol_version),)
-    request = mcp_pb2.ListToolsRequest(common=mcp_pb2.RequestFields())
-    call = grpc_stub.ListTools(request, metadata=metadata)
-    response = await call
-    assert response is not None
-    initial_metadata = await call.initial_metadata()
-    assert initial_metadata is not None
-    found_protocol_version = False
-    for key, value in initial_metadata:
-        if key == "mcp-protocol-version":
-            assert value == protocol_version
-            found_protocol_version = True
-            break
-    assert found_protocol_version, "mcp-protocol-version not found in initial metadata"
-
-
-@pytest.mark.anyio
-async def test_missing_protocol_version_fails_request(grpc_server: None, grpc_stub: "McpAsyncStub"):
-    """Test that requests without mcp-protocol-version metadata fail with UNIMPLEMENTED."""
-    request = mcp_pb2.ListToolsRequest(common=mcp_pb2.RequestFields())
-    with pytest.raises(grpc.aio.AioRpcError) as excinfo:
-        await grpc_stub.ListTools(request, metadata=())
-    assert excinfo.value.code() == grpc.StatusCode.UNIMPLEMENTED
-    assert "Protocol version not provided." in (excinfo.value.details() or "")
 
-
-@pytest.mark.anyio
-async def test_protocol_version_none(grpc_server: None, grpc_stub: "McpAsyncStub"):
-    """Test RPCs with no protocol version in metadata."""
-    request = mcp_pb2.ListToolsRequest(common=mcp_pb2.RequestFields())
-    call = grpc_stub.ListTools(request)
-    with pytest.raises(grpc.aio.AioRpcError) as excinfo:
-        await call
-    assert excinfo.value.code() == grpc.StatusCode.UNIMPLEMENTED
-    assert "Protocol version not provided." in (excinfo.value.details() or "")
-    initial_metadata = await call.initial_metadata()
-    assert initial_metadata is not None
-    found_protocol_version = False
-    for key, value in initial_metadata:
-        if key == "mcp-protocol-version":
-            assert value == version.LATEST_PROTOCOL_VERSION
-            found_protocol_version = True
-            break
-    assert found_protocol_version, "mcp-protocol-version not found in initial metadata"
+@pytest.fixture(scope="module")
+async def grpc_stub(grpc_server: str) -> AsyncGenerator["McpAsyncStub", None]:
+    """Create a gRPC client stub over a channel shared by every test in the module."""
+    async with _connect(grpc_server) as stub:
+        yield stub
 
 
 @pytest.mark.anyio
-@pytest.mark.parametrize("protocol_version", version.SUPPORTED_PROTOCOL_VERSIONS)
-async def test_call_tool_protocol_version_supported(
-    grpc_server: None, grpc_stub: "McpAsyncStub", protocol_version: str
-):
-    """Test CallTool RPCs with a supported protocol version in metadata."""
-    metadata = (("mcp-protocol-version", protocol_version),)
-    tool_name = "greet"
-    arguments = {"name": "Test"}
-    args_struct = struct_pb2.Struct()
-    json_format.ParseDict(arguments, args_struct)
-    request = mcp_pb2.CallToolRequest(
-        common=mcp_pb2.RequestFields(), request=mcp_pb2.CallToolRequest.Request(name=tool_name, arguments=args_struct)
-    )
-
-    call = grpc_stub.CallTool(request, metadata=metadata)
-    responses = [item async for item in call]
-    assert len(responses) == 1
-    assert responses[0].content[0].text.text == "Hello, Test! Welcome to the Simple gRPC Server!"
-    initial_metadata = await call.initial_metadata()
-    assert initial_metadata is not None
-    found_protocol_version = False
-    for key, value in initial_metadata:
-        if key == "mcp-protocol-version":
-            assert value == protocol_version
-            found_protocol_version = True
-            break
-    assert found_protocol_version, "mcp-protocol-version not found in initial metadata"
+@pytest.mark.parametrize("rpc", _VERSIONED_RPC_REQUESTS)
+async def test_protocol_version_supported(grpc_server: str, grpc_stub: "McpAsyncStub", rpc: str):
+    """Test RPCs with a supported protocol version echo that version in initial metadata."""
 
+    async def negotiate(protocol_version: str) -> tuple[list[Any], grpc.aio.Metadata]:
+        call = _start_rpc(grpc_stub, rpc, (("mcp-protocol-version", protocol_version),))
+        # Headers arrive before the response body, so wait on both together.
+        return await asyncio.gather(_responses(call), call.initial_metadata())
 
-@pytest.mark.anyio
-async def test_call_tool_protocol_version_none(grpc_server: None, grpc_stub: "McpAsyncStub"):
-    """Test CallTool RPCs with no protocol version in metadata."""
-    tool_name = "greet"
-    arguments = {"name": "Test"}
-    args_struct = struct_pb2.Struct()
-    json_format.ParseDict(arguments, args_struct)
-    request = mcp_pb2.CallToolRequest(
-        common=mcp_pb2.RequestFields(), request=mcp_pb2.CallToolRequest.Request(name=tool_name, arguments=args_struct)
-    )
-
-    with pytest.raises(grpc.aio.AioRpcError) as excinfo:
-        async for _ in grpc_stub.CallTool(request):
-            pass
-    assert excinfo.value.code() == grpc.StatusCode.UNIMPLEMENTED
-    assert "Protocol version not provided." in (excinfo.value.details() or "")
-    initial_metadata = excinfo.value.initial_metadata()
-    assert initial_metadata is not None
-    found_protocol_version = False
-    for key, value in initial_metadata:
-        if key == "mcp-protocol-version":
-            assert value == version.LATEST_PROTOCOL_VERSION
-            found_protocol_version = True
-            break
-    assert found_protocol_version, "mcp-protocol-version not found in initial metadata"
+    # One call per version, multiplexed over the shared channel.
+    results = await asyncio.gather(*(negotiate(v) for v in version.SUPPORTED_PROTOCOL_VERSIONS))
+    for protocol_version, (responses, initial_metadata) in zip(version.SUPPORTED_PROTOCOL_VERSIONS, results):
+        assert len(responses) == 1
+        assert initial_metadata.get("mcp-protocol-version") == protocol_version
 
 
 @pytest.mark.anyio
-async def test_protocol_version_unsupported(grpc_server: None, grpc_stub: "McpAsyncStub"):
-    """Test RPCs with an unsupported protocol version in metadata.
+@pytest.mark.parametrize("rpc", _VERSIONED_RPC_REQUESTS)
+@pytest.mark.parametrize(
+    "metadata, details",
+    [
+        pytest.param(None, "Protocol version not provided.", id="none"),
+        pytest.param((), "Protocol version not provided.", id="empty"),
+        pytest.param(
+            (("mcp-protocol-version", "unsupported-version"),),
+            "Unsupported protocol version: unsupported-version",
+            id="unsupported",
+        ),
+    ],
+)
+async def test_protocol_version_rejected(
+    grpc_server: str,
+    grpc_stub: "McpAsyncStub",
+    rpc: str,
+    metadata: tuple[tuple[str, str], ...] | None,
+    details: str,
+):
+    """Test RPCs without a supported protocol version fail with UNIMPLEMENTED.
 
-    The server should return an UNIMPLEMENTED error and include the latest supported
-    protocol version in the initial metadata.
+    The server should include the latest supported protocol version in the initial metadata.
     """
-    metadata = (("mcp-protocol-version", "unsupported-version"),)
-    request = mcp_pb2.ListToolsRequest(common=mcp_pb2.RequestFields())
-    call = grpc_stub.ListTools(request, metadata=metadata)
-    with pytest.raises(grpc.aio.AioRpcError) as excinfo:
-        await call
-    assert excinfo.value.code() == grpc.StatusCode.UNIMPLEMENTED
-    assert "Unsupported protocol version: unsupported-version" in (excinfo.value.details() or "")
-    initial_metadata = await call.initial_metadata()
-    assert initial_metadata is not None
-    found_protocol_version = False
-    for key, value in initial_metadata:
-        if key == "mcp-protocol-version":
-            assert value == version.LATEST_PROTOCOL_VERSION
-            found_protocol_version = True
-            break
-    assert found_protocol_version, "mcp-protocol-version not found in initial metadata"
+    call = _start_rpc(grpc_stub, rpc, metadata)
+    error = await _assert_rpc_error(_responses(call), grpc.StatusCode.UNIMPLEMENTED, details)
+    assert error.initial_metadata().get("mcp-protocol-version") == version.LATEST_PROTOCOL_VERSION
 
 
 @pytest.mark.anyio
-async def test_call_tool_unsupported_version_returns_latest(grpc_server: None, grpc_stub: "McpAsyncStub"):
-    """Test that unsupported protocol versions return the latest version in trailing metadata for CallTool."""
-    metadata = (("mcp-protocol-version", "unsupported-version"),)
-    tool_name = "greet"
-    arguments = {"name": "Test"}
-    args_struct = struct_pb2.Struct()
-    json_format.ParseDict(arguments, args_struct)
-    request = mcp_pb2.CallToolRequest(
-        common=mcp_pb2.RequestFields(), request=mcp_pb2.CallToolRequest.Request(name=tool_name, arguments=args_struct)
-    )
-
-    with pytest.raises(grpc.aio.AioRpcError) as excinfo:
-        async for _ in grpc_stub.CallTool(request, metadata=metadata):
-            pass
-    assert excinfo.value.code() == grpc.StatusCode.UNIMPLEMENTED
-
-
-@pytest.mark.anyio
-async def test_list_resources_grpc(grpc_server: None, grpc_stub: "McpAsyncStub"):
+async def test_list_resources_grpc(grpc_server: str, grpc_stub: "McpAsyncStub"):
     """Test ListResources via gRPC."""
-    metadata = (("mcp-protocol-version", version.LATEST_PROTOCOL_VERSION),)
-    request = mcp_pb2.ListResourcesRequest()
-    response = await grpc_stub.ListResources(request, metadata=metadata)
+    response = await grpc_stub.ListResources(_LIST_RES_REQ, metadata=_LATEST_MD)
 
     assert response is not None
     assert len(response.resources) == 6
@@ -349,11 +454,9 @@ async def test_list_resources_grpc(grpc_server: None, grpc_stub: "McpAsyncStub")
 
 
 @pytest.mark.anyio
-async def test_list_resource_templates_grpc(grpc_server: None, grpc_stub: "McpAsyncStub"):
+async def test_list_resource_templates_grpc(grpc_server: str, grpc_stub: "McpAsyncStub"):
     """Test ListResourceTemplates via gRPC."""
-    request = mcp_pb2.ListResourceTemplatesRequest(common=mcp_pb2.RequestFields())
-    metadata = (("mcp-protocol-version", version.LATEST_PROTOCOL_VERSION),)
-    response = await grpc_stub.ListResourceTemplates(request, metadata=metadata)
+    response = await grpc_stub.ListResourceTemplates(_LIST_TPL_REQ, metadata=_LATEST_MD)
 
     assert response is not None
     assert len(response.resource_templates) == 2
@@ -368,11 +471,9 @@ async def test_list_resource_templates_grpc(grpc_server: None, grpc_stub: "McpAs
 
 
 @pytest.mark.anyio
-async def test_list_resources_grpc_binary(grpc_server: None, grpc_stub: "McpAsyncStub"):
+async def test_list_resources_grpc_binary(grpc_server: str, grpc_stub: "McpAsyncStub"):
     """Test ListResources via gRPC for binary resource."""
-    request = mcp_pb2.ListResourcesRequest(common=mcp_pb2.RequestFields())
-    metadata = (("mcp-protocol-version", version.LATEST_PROTOCOL_VERSION),)
-    response = await grpc_stub.ListResources(request, metadata=metadata)
+    response = await grpc_stub.ListResources(_LIST_RES_REQ, metadata=_LATEST_MD)
 
     assert response is not None
     resources = {r.name: r for r in response.resources}
@@ -383,142 +484,28 @@ async def test_list_resources_grpc_binary(grpc_server: None, grpc_stub: "McpAsyn
 
 
 @pytest.mark.anyio
-async def test_list_tools_grpc(grpc_server: None, grpc_stub: "McpAsyncStub"):
+async def test_list_tools_grpc(grpc_server: str, grpc_stub: "McpAsyncStub"):
     """Test ListTools via gRPC."""
-    request = mcp_pb2.ListToolsRequest(common=mcp_pb2.RequestFields())
-    metadata = (("mcp-protocol-version", version.LATEST_PROTOCOL_VERSION),)
-    response = await grpc_stub.ListTools(request, metadata=metadata)
+    response = await grpc_stub.ListTools(_LIST_TOOLS_REQ, metadata=_LATEST_MD)
 
     assert response is not None
-    assert len(response.tools) == 7
+    assert len(response.tools) == 6
 
     tools_by_name = {tool.name: tool for tool in response.tools}
 
-    expected_tools: dict[str, Any] = {
-        "greet": {
-            "name": "greet",
-            "description": "A simple greeting tool.",
-            "inputSchema": {
-                "properties": {"name": {"title": "Name", "type": "string"}},
-                "required": ["name"],
-                "title": "greetArguments",
-                "type": "object",
-            },
-            "outputSchema": {
-                "properties": {"result": {"title": "Result", "type": "string"}},
-                "required": ["result"],
-                "title": "greetOutput",
-                "type": "object",
-            },
-        },
-        "test_tool": {
-            "name": "test_tool",
-            "description": "A test tool that adds two numbers.",
-            "inputSchema": {
-                "properties": {
-                    "a": {"title": "A", "type": "integer"},
-                    "b": {"title": "B", "type": "integer"},
-                },
-                "required": ["a", "b"],
-                "title": "test_toolArguments",
-                "type": "object",
-            },
-            "outputSchema": {
-                "properties": {"result": {"title": "Result", "type": "integer"}},
-                "required": ["result"],
-                "title": "test_toolOutput",
-                "type": "object",
-            },
-        },
-        "failing_tool": {
-            "name": "failing_tool",
-            "description": "A tool that always fails.",
-            "inputSchema": {
-                "properties": {},
-                "title": "failing_toolArguments",
-                "type": "object",
-            },
-            "outputSchema": {
-                "properties": {"result": {"title": "Result", "type": "string"}},
-                "required": ["result"],
-                "title": "failing_toolOutput",
-                "type": "object",
-            },
-        },
-        "list_tool": {
-            "name": "list_tool",
-            "description": "A tool that returns a list of strings.",
-            "inputSchema": {
-                "properties": {},
-                "title": "list_toolArguments",
-                "type": "object",
-            },
-            "outputSchema": {
-                "properties": {
-                    "result": {
-                        "items": {"type": "string"},
-                        "title": "Result",
-                        "type": "array",
-                    }
-                },
-                "required": ["result"],
-                "title": "list_toolOutput",
-                "type": "object",
-            },
-        },
-        "dict_tool": {
-            "name": "dict_tool",
-            "description": "A tool that returns a dict.",
-            "inputSchema": {
-                "properties": {},
-                "title": "dict_toolArguments",
-                "type": "object",
-            },
-            "outputSchema": {},
-        },
-        "structured_dict_tool": {
-            "name": "structured_dict_tool",
-            "description": "A tool that returns a dict via pydantic model.",
-            "inputSchema": {
-                "properties": {},
-                "title": "structured_dict_toolArguments",
-                "type": "object",
-            },
-            "outputSchema": {
-                "properties": {"key": {"title": "Key", "type": "string"}},
-                "required": ["key"],
-                "title": "DictOutput",
-                "type": "object",
-            },
-        },
-        "blocking_tool": {
-            "name": "blocking_tool",
-            "description": "A tool that blocks until cancelled.",
-            "inputSchema": {
-                "properties": {},
-                "title": "blocking_toolArguments",
-                "type": "object",
-            },
-            "outputSchema": {},
-        },
-    }
-
-    assert tools_by_name.keys() == expected_tools.keys()
+    assert tools_by_name.keys() == _EXPECTED_TOOLS.keys()
 
     for tool_name, tool in tools_by_name.items():
-        expected_tool = expected_tools[tool_name]
+        expected_tool = _EXPECTED_TOOLS[tool_name]
         assert tool.name == expected_tool["name"]
         assert tool.description == expected_tool["description"]
-        assert json_format.MessageToDict(tool.input_schema) == expected_tool["inputSchema"]
-        assert json_format.MessageToDict(tool.output_schema) == expected_tool["outputSchema"]
+        assert (tool.input_schema, tool.output_schema) == _EXPECTED_TOOL_SCHEMAS[tool_name]
 
 
-def setup_failing_test_server(port: int) -> FastMCP:
+def setup_failing_test_server() -> FastMCP:
     """Set up a FastMCP server that fails on list_tools."""
     mcp = FastMCP(
         name="Failing Test gRPC Server",
-        host="127.0.0.1",
-        port=port,
     )
 
     async def failing_list_tools():
@@ -528,12 +515,10 @@ def setup_failing_test_server(port: int) -> FastMCP:
     return mcp
 
 
-def setup_failing_test_server_for_resources(port: int) -> FastMCP:
+def setup_failing_test_server_for_resources() -> FastMCP:
     """Set up a FastMCP server that fails on list_resources."""
     mcp = FastMCP(
         name="Failing Test gRPC Server",
-        host="127.0.0.1",
-        port=port,
     )
 
     async def failing_list_resources():
@@ -543,12 +528,10 @@ def setup_failing_test_server_for_resources(port: int) -> FastMCP:
     return mcp
 
 
-def setup_failing_test_server_for_resource_templates(port: int) -> FastMCP:
+def setup_failing_test_server_for_resource_templates() -> FastMCP:
     """Set up a FastMCP server that fails on list_resource_templates."""
     mcp = FastMCP(
         name="Failing Test gRPC Server",
-        host="127.0.0.1",
-        port=port,
     )
 
     async def failing_list_resource_templates():
@@ -559,377 +542,217 @@ def setup_failing_test_server_for_resource_templates(port: int) -> FastMCP:
 
 
 @pytest.fixture
-def failing_server_port() -> int:
-    """Find an available port for the server."""
-    with socket.socket() as s:
-        s.bind(("127.0.0.1", 0))
-        return s.getsockname()[1]
-
-
-@pytest.fixture
-async def failing_grpc_server(failing_server_port: int) -> AsyncGenerator[None, None]:
-    """Start a gRPC server in process that fails on list_tools."""
-    server_instance = setup_failing_test_server(failing_server_port)
-    server = await create_mcp_grpc_server(target=f"127.0.0.1:{failing_server_port}", mcp_server=server_instance)
-
-    yield
-    await server.stop(None)
+async def failing_grpc_server() -> AsyncGenerator[str, None]:
+    """Start a gRPC server in process that fails on list_tools and yield its target."""
+    async with _serve(setup_failing_test_server()) as target:
+        yield target
 
 
 @pytest.fixture
-async def failing_grpc_server_for_resources(
-    failing_server_port: int,
-) -> AsyncGenerator[None, None]:
-    """Start a gRPC server in process that fails on list_resources."""
-    server_instance = setup_failing_test_server_for_resources(failing_server_port)
-    server = await create_mcp_grpc_server(target=f"127.0.0.1:{failing_server_port}", mcp_server=server_instance)
-
-    yield
-    await server.stop(None)
+async def failing_grpc_server_for_resources() -> AsyncGenerator[str, None]:
+    """Start a gRPC server in process that fails on list_resources and yield its target."""
+    async with _serve(setup_failing_test_server_for_resources()) as target:
+        yield target
 
 
 @pytest.fixture
-async def failing_grpc_server_for_resource_templates(
-    failing_server_port: int,
-) -> AsyncGenerator[None, None]:
-    """Start a gRPC server in process that fails on list_resource_templates."""
-    server_instance = setup_failing_test_server_for_resource_templates(failing_server_port)
-    server = await create_mcp_grpc_server(target=f"127.0.0.1:{failing_server_port}", mcp_server=server_instance)
-
-    yield
-    await server.stop(None)
-
-
-@pytest.fixture
-async def failing_grpc_stub(
-    failing_server_port: int,
-) -> AsyncGenerator["McpAsyncStub", None]:
-    """Create a gRPC client stub for failing server."""
-    async with grpc.aio.insecure_channel(f"127.0.0.1:{failing_server_port}") as channel:
-        stub = mcp_pb2_grpc.McpStub(channel)
-        yield cast("McpAsyncStub", stub)
+async def failing_grpc_server_for_resource_templates() -> AsyncGenerator[str, None]:
+    """Start a gRPC server in process that fails on list_resource_templates and yield its target."""
+    async with _serve(setup_failing_test_server_for_resource_templates()) as target:
+        yield target
 
 
 @pytest.mark.anyio
-async def test_list_resources_grpc_error(failing_grpc_server_for_resources: None, failing_grpc_stub: "McpAsyncStub"):
+async def test_list_resources_grpc_error(failing_grpc_server_for_resources: str):
     """Test ListResources via gRPC when server handler raises an error."""
-    request = mcp_pb2.ListResourcesRequest(common=mcp_pb2.RequestFields())
-    metadata = (("mcp-protocol-version", version.LATEST_PROTOCOL_VERSION),)
-    with pytest.raises(grpc.aio.AioRpcError) as excinfo:
-        await failing_grpc_stub.ListResources(request, metadata=metadata)
-
-    assert excinfo.value.code() == grpc.StatusCode.INTERNAL
-    assert "This is an intentional error for resources" in (excinfo.value.details() or "")
+    async with _connect(failing_grpc_server_for_resources) as stub:
+        await _assert_rpc_error(
+            stub.ListResources(_LIST_RES_REQ, metadata=_LATEST_MD),
+            grpc.StatusCode.INTERNAL,
+            "This is an intentional error for resources",
+        )
 
 
 @pytest.mark.anyio
-async def test_list_resources_grpc_parse_error(grpc_server: None, grpc_stub: "McpAsyncStub"):
+async def test_list_resources_grpc_parse_error(grpc_server: str, grpc_stub: "McpAsyncStub"):
     """Test ListResources via gRPC when conversion raises ParseError."""
-    request = mcp_pb2.ListResourcesRequest(common=mcp_pb2.RequestFields())
-    metadata = (("mcp-protocol-version", version.LATEST_PROTOCOL_VERSION),)
     with unittest.mock.patch(
         "mcp.server.grpc.convert.resource_types_to_protos",
         side_effect=json_format.ParseError("Intentional ParseError"),
     ):
-        with pytest.raises(grpc.aio.AioRpcError) as excinfo:
-            await grpc_stub.ListResources(request, metadata=metadata)
-
-    assert excinfo.value.code() == grpc.StatusCode.INVALID_ARGUMENT
-    assert "Failed to parse resource data" in (excinfo.value.details() or "")
+        await _assert_rpc_error(
+            grpc_stub.ListResources(_LIST_RES_REQ, metadata=_LATEST_MD),
+            grpc.StatusCode.INVALID_ARGUMENT,
+            "Failed to parse resource data",
+        )
 
 
 @pytest.mark.anyio
-async def test_list_resource_templates_grpc_exception(
-    failing_grpc_server_for_resource_templates: None,
-    failing_grpc_stub: "McpAsyncStub",
-):
+async def test_list_resource_templates_grpc_exception(failing_grpc_server_for_resource_templates: str):
     """Test ListResourceTemplates via gRPC when server handler raises an exception."""
-    request = mcp_pb2.ListResourceTemplatesRequest(common=mcp_pb2.RequestFields())
-    metadata = (("mcp-protocol-version", version.LATEST_PROTOCOL_VERSION),)
-    with pytest.raises(grpc.aio.AioRpcError) as excinfo:
-        await failing_grpc_stub.ListResourceTemplates(request, metadata=metadata)
-
-    assert excinfo.value.code() == grpc.StatusCode.INTERNAL
-    assert "This is an intentional error for resource templates" in (excinfo.value.details() or "")
+    async with _connect(failing_grpc_server_for_resource_templates) as stub:
+        await _assert_rpc_error(
+            stub.ListResourceTemplates(_LIST_TPL_REQ, metadata=_LATEST_MD),
+            grpc.StatusCode.INTERNAL,
+            "This is an intentional error for resource templates",
+        )
 
 
 @pytest.mark.anyio
-async def test_list_resource_templates_grpc_parse_error(grpc_server: None, grpc_stub: "McpAsyncStub"):
+async def test_list_resource_templates_grpc_parse_error(grpc_server: str, grpc_stub: "McpAsyncStub"):
     """Test ListResourceTemplates via gRPC when conversion raises ParseError."""
-    request = mcp_pb2.ListResourceTemplatesRequest(common=mcp_pb2.RequestFields())
-    metadata = (("mcp-protocol-version", version.LATEST_PROTOCOL_VERSION),)
     with unittest.mock.patch(
         "mcp.server.grpc.convert.resource_template_types_to_protos",
         side_effect=json_format.ParseError("Intentional ParseError"),
     ):
-        with pytest.raises(grpc.aio.AioRpcError) as excinfo:
-            await grpc_stub.ListResourceTemplates(request, metadata=metadata)
-
-    assert excinfo.value.code() == grpc.StatusCode.INVALID_ARGUMENT
-    assert "Failed to parse resource template data" in (excinfo.value.details() or "")
+        await _assert_rpc_error(
+            grpc_stub.ListResourceTemplates(_LIST_TPL_REQ, metadata=_LATEST_MD),
+            grpc.StatusCode.INVALID_ARGUMENT,
+            "Failed to parse resource template data",
+        )
 
 
 @pytest.mark.anyio
-async def test_read_resource_grpc(grpc_server: None, grpc_stub: "McpAsyncStub"):
+async def test_read_resource_grpc(grpc_server: str, grpc_stub: "McpAsyncStub"):
     """Test ReadResource via gRPC."""
-    request = mcp_pb2.ReadResourceRequest(
-        common=mcp_pb2.RequestFields(),
-        uri="test://data",
+    # The three reads are independent, so issue them concurrently over the shared channel.
+    text_response, binary_response, file_response = await asyncio.gather(
+        grpc_stub.ReadResource(_REQ_READ_DATA, metadata=_LATEST_MD),
+        grpc_stub.ReadResource(_REQ_READ_BINARY, metadata=_LATEST_MD),
+        grpc_stub.ReadResource(_REQ_READ_EXAMPLE_PY, metadata=_LATEST_MD),
     )
-    metadata = (("mcp-protocol-version", version.LATEST_PROTOCOL_VERSION),)
-    response = await grpc_stub.ReadResource(request, metadata=metadata)
 
-    assert response is not None
-    assert response.resource[0].text == "resource data"
-    assert response.resource[0].mime_type == "text/plain"
-
-    request = mcp_pb2.ReadResourceRequest(
-        common=mcp_pb2.RequestFields(),
-        uri="test://binary_resource",
-    )
-    metadata = (("mcp-protocol-version", version.LATEST_PROTOCOL_VERSION),)
-    response = await grpc_stub.ReadResource(request, metadata=metadata)
-    assert response is not None
-    assert response.resource[0].blob == b"binary data"
-    assert response.resource[0].mime_type == "application/octet-stream"
-
-    request = mcp_pb2.ReadResourceRequest(
-        common=mcp_pb2.RequestFields(),
-        uri="file://test_dir/example.py",
-    )
-    metadata = (("mcp-protocol-version", version.LATEST_PROTOCOL_VERSION),)
-    response = await grpc_stub.ReadResource(request, metadata=metadata)
-    assert response is not None
-    assert response.resource[0].text == "print('hello')"
+    assert text_response.resource[0].text == "resource data"
+    assert text_response.resource[0].mime_type == "text/plain"
+    assert binary_response.resource[0].blob == b"binary data"
+    assert binary_response.resource[0].mime_type == "application/octet-stream"
+    assert file_response.resource[0].text == "print('hello')"
 
 
 @pytest.mark.anyio
-async def test_read_empty_resource_grpc(grpc_server: None, grpc_stub: "McpAsyncStub"):
+async def test_read_empty_resource_grpc(grpc_server: str, grpc_stub: "McpAsyncStub"):
     """Test ReadResource via gRPC when resource is empty."""
     request = mcp_pb2.ReadResourceRequest(
-        common=mcp_pb2.RequestFields(),
+        common=_EMPTY_COMMON,
         uri="test://empty_resource",
     )
-    metadata = (("mcp-protocol-version", version.LATEST_PROTOCOL_VERSION),)
-    response = await grpc_stub.ReadResource(request, metadata=metadata)
+    response = await grpc_stub.ReadResource(request, metadata=_LATEST_MD)
     assert response is not None
     assert response.resource[0].text == ""
     assert response.resource[0].mime_type == "text/plain"
 
 
 @pytest.mark.anyio
-async def test_read_resource_not_found_grpc(grpc_server: None, grpc_stub: "McpAsyncStub"):
+async def test_read_resource_not_found_grpc(grpc_server: str, grpc_stub: "McpAsyncStub"):
     """Test ReadResource via gRPC when resource not found."""
     request = mcp_pb2.ReadResourceRequest(
-        common=mcp_pb2.RequestFields(),
+        common=_EMPTY_COMMON,
         uri="test://not-found",
     )
-    metadata = (("mcp-protocol-version", version.LATEST_PROTOCOL_VERSION),)
-    with pytest.raises(grpc.aio.AioRpcError) as excinfo:
-        await grpc_stub.ReadResource(request, metadata=metadata)
-
-    assert excinfo.value.code() == grpc.StatusCode.NOT_FOUND
+    await _assert_rpc_error(grpc_stub.ReadResource(request, metadata=_LATEST_MD), grpc.StatusCode.NOT_FOUND)
 
 
 @pytest.mark.anyio
-async def test_read_empty_template_resource_grpc(grpc_server: None, grpc_stub: "McpAsyncStub"):
+async def test_read_empty_template_resource_grpc(grpc_server: str, grpc_stub: "McpAsyncStub"):
     """Test ReadResource via gRPC when resource is empty."""
     request = mcp_pb2.ReadResourceRequest(
-        common=mcp_pb2.RequestFields(),
+        common=_EMPTY_COMMON,
         uri="test://template_empty/world",
     )
-    metadata = (("mcp-protocol-version", version.LATEST_PROTOCOL_VERSION),)
-    response = await grpc_stub.ReadResource(request, metadata=metadata)
+    response = await grpc_stub.ReadResource(request, metadata=_LATEST_MD)
     assert response is not None
     assert response.resource[0].text == ""
     assert response.resource[0].mime_type == "text/plain"
 
 
 @pytest.mark.anyio
-async def test_list_tools_grpc_error(failing_grpc_server: None, failing_grpc_stub: "McpAsyncStub"):
+async def test_list_tools_grpc_error(failing_grpc_server: str):
     """Test ListTools via gRPC when server handler raises an error."""
-    request = mcp_pb2.ListToolsRequest(common=mcp_pb2.RequestFields())
-    metadata = (("mcp-protocol-version", version.LATEST_PROTOCOL_VERSION),)
-    with pytest.raises(grpc.aio.AioRpcError) as excinfo:
-        await failing_grpc_stub.ListTools(request, metadata=metadata)
-
-    assert excinfo.value.code() == grpc.StatusCode.INTERNAL
-    assert "This is an intentional error" in (excinfo.value.details() or "")
-
-
-@pytest.mark.anyio
-async def test_call_tool_grpc_greet(grpc_server: None, grpc_stub: "McpAsyncStub"):
-    """Test CallTool via gRPC with greet tool."""
-    tool_name = "greet"
-    arguments = {"name": "Test"}
-    args_struct = struct_pb2.Struct()
-    json_format.ParseDict(arguments, args_struct)
-
-    request = mcp_pb2.CallToolRequest(
-        common=mcp_pb2.RequestFields(), request=mcp_pb2.CallToolRequest.Request(name=tool_name, arguments=args_struct)
-    )
-
-    metadata = (("mcp-protocol-version", version.LATEST_PROTOCOL_VERSION),)
-    responses = [response async for response in grpc_stub.CallTool(request, metadata=metadata)]
-
-    assert len(responses) == 1
-    assert responses[0].content[0].text.text == "Hello, Test! Welcome to the Simple gRPC Server!"
-    assert not responses[0].is_error
-    assert responses[0].structured_content["result"] == "Hello, Test! Welcome to the Simple gRPC Server!"
+    async with _connect(failing_grpc_server) as stub:
+        await _assert_rpc_error(
+            stub.ListTools(_LIST_TOOLS_REQ, metadata=_LATEST_MD),
+            grpc.StatusCode.INTERNAL,
+            "This is an intentional error",
+        )
 
 
 @pytest.mark.anyio
-async def test_call_tool_grpc_invalid_input(grpc_server: None, grpc_stub: "McpAsyncStub"):
-    """Test CallTool via gRPC with invalid tool input."""
-    tool_name = "greet"
-    arguments = {"name": 123}  # Invalid input, should be string
-    args_struct = struct_pb2.Struct()
-    json_format.ParseDict(arguments, args_struct)
-
-    request = mcp_pb2.CallToolRequest(
-        common=mcp_pb2.RequestFields(), request=mcp_pb2.CallToolRequest.Request(name=tool_name, arguments=args_struct)
-    )
-
-    metadata = (("mcp-protocol-version", version.LATEST_PROTOCOL_VERSION),)
-    responses = [response async for response in grpc_stub.CallTool(request, metadata=metadata)]
-
-    assert len(responses) == 1
-    assert responses[0].is_error
-    assert "validation error" in responses[0].content[0].text.text
-
-
-@pytest.mark.anyio
-async def test_call_tool_grpc_test_tool(grpc_server: None, grpc_stub: "McpAsyncStub"):
-    """Test CallTool via gRPC with test_tool."""
-    tool_name = "test_tool"
-    arguments = {"a": 1, "b": 2}
-    args_struct = struct_pb2.Struct()
-    json_format.ParseDict(arguments, args_struct)
-
-    request = mcp_pb2.CallToolRequest(
-        common=mcp_pb2.RequestFields(), request=mcp_pb2.CallToolRequest.Request(name=tool_name, arguments=args_struct)
-    )
-
-    metadata = (("mcp-protocol-version", version.LATEST_PROTOCOL_VERSION),)
-    responses = [response async for response in grpc_stub.CallTool(request, metadata=metadata)]
+@pytest.mark.parametrize(
+    "request_message, texts, structured_content",
+    [
+        pytest.param(
+            _GREET_REQUEST,
+            ("Hello, Test! Welcome to the Simple gRPC Server!",),
+            {"result": "Hello, Test! Welcome to the Simple gRPC Server!"},
+            id="greet",
+        ),
+        pytest.param(_make_call_tool_request("test_tool", {"a": 1, "b": 2}), ("3",), {"result": 3}, id="test_tool"),
+        pytest.param(
+            _make_call_tool_request("list_tool", {}), ("one", "two"), {"result": ["one", "two"]}, id="list_tool"
+        ),
+        # dict_tool has no output schema, so it returns no structured content.
+        pytest.param(_make_call_tool_request("dict_tool", {}), (_EXPECTED_DICT,), {}, id="dict_tool"),
+        pytest.param(
+            _make_call_tool_request("structured_dict_tool", {}),
+            (_EXPECTED_DICT,),
+            {"key": "value"},
+            id="structured_dict_tool",
+        ),
+    ],
+)
+async def test_call_tool_grpc(
+    grpc_server: str,
+    grpc_stub: "McpAsyncStub",
+    request_message: mcp_pb2.CallToolRequest,
+    texts: tuple[str | dict[str, Any], ...],
+    structured_content: dict[str, Any],
+):
+    """Test CallTool via gRPC with tools that succeed."""
+    responses = await _drain(grpc_stub.CallTool(request_message, metadata=_LATEST_MD))
 
     assert len(responses) == 1
-    assert responses[0].content[0].text.text == "3"
     assert not responses[0].is_error
-    assert responses[0].structured_content["result"] == 3
-
-
-@pytest.mark.anyio
-async def test_call_failing_tool_grpc(grpc_server: None, grpc_stub: "McpAsyncStub"):
-    """Test CallTool with a tool that raises an error."""
-    tool_name = "failing_tool"
-    arguments = {}
-    args_struct = struct_pb2.Struct()
-    json_format.ParseDict(arguments, args_struct)
-
-    request = mcp_pb2.CallToolRequest(
-        common=mcp_pb2.RequestFields(), request=mcp_pb2.CallToolRequest.Request(name=tool_name, arguments=args_struct)
+    # Dict expectations are JSON text, so compare them parsed rather than by formatting.
+    actual_texts = tuple(
+        json.loads(content.text.text) if isinstance(expected, dict) else content.text.text
+        for content, expected in zip(responses[0].content, texts, strict=True)
     )
-
-    metadata = (("mcp-protocol-version", version.LATEST_PROTOCOL_VERSION),)
-    responses = [response async for response in grpc_stub.CallTool(request, metadata=metadata)]
-
-    assert len(responses) == 1
-    assert responses[0].is_error
-    assert "Error executing tool failing_tool: This tool is designed to fail." in responses[0].content[0].text.text
-
-
-@pytest.mark.anyio
-async def test_call_tool_not_found_grpc(grpc_server: None, grpc_stub: "McpAsyncStub"):
-    """Test CallTool with a tool that is not found."""
-    tool_name = "non_existent_tool"
-    arguments = {}
-    args_struct = struct_pb2.Struct()
-    json_format.ParseDict(arguments, args_struct)
-
-    request = mcp_pb2.CallToolRequest(
-        common=mcp_pb2.RequestFields(), request=mcp_pb2.CallToolRequest.Request(name=tool_name, arguments=args_struct)
-    )
-
-    metadata = (("mcp-protocol-version", version.LATEST_PROTOCOL_VERSION),)
-    responses = [response async for response in grpc_stub.CallTool(request, metadata=metadata)]
-
-    assert len(responses) == 1
-    assert responses[0].is_error
-    assert f"Tool '{tool_name}' not found." in responses[0].content[0].text.text
-
-
-@pytest.mark.anyio
-async def test_call_tool_grpc_list_tool(grpc_server: None, grpc_stub: "McpAsyncStub"):
-    """Test CallTool via gRPC with list_tool."""
-    tool_name = "list_tool"
-    arguments = {}
-    args_struct = struct_pb2.Struct()
-    json_format.ParseDict(arguments, args_struct)
-
-    request = mcp_pb2.CallToolRequest(
-        common=mcp_pb2.RequestFields(), request=mcp_pb2.CallToolRequest.Request(name=tool_name, arguments=args_struct)
-    )
-
-    metadata = (("mcp-protocol-version", version.LATEST_PROTOCOL_VERSION),)
-    responses = [response async for response in grpc_stub.CallTool(request, metadata=metadata)]
-
-    assert len(responses) == 1
-    assert responses[0].content[0].text.text == "one"
-    assert responses[0].content[1].text.text == "two"
-    assert not responses[0].is_error
-    assert responses[0].structured_content["result"] == ["one", "two"]
+    assert actual_texts == texts
+    assert responses[0].structured_content == _to_struct(structured_content)
 
 
 @pytest.mark.anyio
-async def test_call_tool_grpc_no_initial_request(grpc_server: None, grpc_stub: "McpAsyncStub"):
-    """Test CallTool via gRPC with no initial request."""
-    request = mcp_pb2.CallToolRequest(common=mcp_pb2.RequestFields())
-
-    metadata = (("mcp-protocol-version", version.LATEST_PROTOCOL_VERSION),)
-    responses = [response async for response in grpc_stub.CallTool(request, metadata=metadata)]
+@pytest.mark.parametrize(
+    "request_message, error_text",
+    [
+        pytest.param(
+            _make_call_tool_request("greet", {"name": 123}),  # Invalid input, should be string
+            "validation error",
+            id="invalid_input",
+        ),
+        pytest.param(
+            _make_call_tool_request("failing_tool", {}),
+            "Error executing tool failing_tool: This tool is designed to fail.",
+            id="failing_tool",
+        ),
+        pytest.param(
+            _make_call_tool_request("non_existent_tool", {}),
+            "Tool 'non_existent_tool' not found.",
+            id="not_found",
+        ),
+        pytest.param(
+            _EMPTY_REQUEST,
+            "Initial request cannot be empty.",
+            id="no_initial_request",
+        ),
+    ],
+)
+async def test_call_tool_grpc_error_result(
+    grpc_server: str, grpc_stub: "McpAsyncStub", request_message: mcp_pb2.CallToolRequest, error_text: str
+):
+    """Test CallTool via gRPC reports tool failures as an error result rather than an RPC error."""
+    responses = await _drain(grpc_stub.CallTool(request_message, metadata=_LATEST_MD))
 
     assert len(responses) == 1
     assert responses[0].is_error
-    assert "Initial request cannot be empty." in responses[0].content[0].text.text
-
-
-@pytest.mark.anyio
-async def test_call_tool_grpc_dict_tool(grpc_server: None, grpc_stub: "McpAsyncStub"):
-    """Test CallTool via gRPC with dict_tool."""
-    tool_name = "dict_tool"
-    arguments = {}
-    args_struct = struct_pb2.Struct()
-    json_format.ParseDict(arguments, args_struct)
-
-    request = mcp_pb2.CallToolRequest(
-        common=mcp_pb2.RequestFields(), request=mcp_pb2.CallToolRequest.Request(name=tool_name, arguments=args_struct)
-    )
-
-    metadata = (("mcp-protocol-version", version.LATEST_PROTOCOL_VERSION),)
-    responses = [response async for response in grpc_stub.CallTool(request, metadata=metadata)]
-
-    assert len(responses) == 1
-    assert json.loads(responses[0].content[0].text.text) == {"key": "value"}
-    assert not responses[0].is_error
-
-
-@pytest.mark.anyio
-async def test_call_tool_grpc_structured_dict_tool(grpc_server: None, grpc_stub: "McpAsyncStub"):
-    """Test CallTool via gRPC with structured_dict_tool."""
-    tool_name = "structured_dict_tool"
-    arguments = {}
-    args_struct = struct_pb2.Struct()
-    json_format.ParseDict(arguments, args_struct)
-
-    request = mcp_pb2.CallToolRequest(
-        common=mcp_pb2.RequestFields(), request=mcp_pb2.CallToolRequest.Request(name=tool_name, arguments=args_struct)
-    )
-
-    metadata = (("mcp-protocol-version", version.LATEST_PROTOCOL_VERSION),)
-    responses = [response async for response in grpc_stub.CallTool(request, metadata=metadata)]
-
-    assert len(responses) == 1
-    assert json.loads(responses[0].content[0].text.text) == {"key": "value"}
-    assert not responses[0].is_error
-    assert responses[0].structured_content == {"key": "value"}
+    assert error_text in responses[0].content[0].text.text
@@ -37,6 +37,18 @@ def test_ttl_from_timedelta():
     ttl_proto = convert.ttl_from_timedelta(delta)
     assert ttl_proto == duration_pb2.Duration(seconds=0, nanos=0)
 
+    delta = timedelta(seconds=-1, microseconds=-500000)
+    ttl_proto = convert.ttl_from_timedelta(delta)
+    assert ttl_proto == duration_pb2.Duration(seconds=-1, nanos=-500000000)
+
+
+def test_ttl_from_timedelta_into():
+    """Test ttl_from_timedelta_into writes into an existing message field."""
+    response = mcp_pb2.ListToolsResponse()
+    convert.ttl_from_timedelta_into(response.ttl, timedelta(seconds=1, microseconds=500000))
+    assert response.HasField("ttl")
+    assert response.ttl == duration_pb2.Duration(seconds=1, nanos=500000000)
+
 
 def test_timedelta_from_ttl():
     """Test timedelta_from_ttl."""
@@ -56,6 +68,10 @@ def test_timedelta_from_ttl():
     delta = convert.timedelta_from_ttl(ttl_proto)
     assert delta == timedelta(seconds=0)
 
+    ttl_proto = duration_pb2.Duration(seconds=-1, nanos=-500000000)
+    delta = convert.timedelta_from_ttl(ttl_proto)
+    assert delta == timedelta(seconds=-1, microseconds=-500000)
+
 
 def test_resource_type_to_proto_valid():
     """Test conversion of a valid types.Resource to a proto message."""
@@ -383,29 +399,38 @@ def test_tool_proto_to_type_empty_schemas():
     assert converted_tool == expected_tool_type
 
 
+def test_tool_proto_to_type_schema_value_kinds():
+    """Test that every Struct value kind converts like json_format.MessageToDict."""
+    input_schema = struct_pb2.Struct()
+    input_schema.update(
+        {
+            "type": "object",
+            "properties": {"a": {"enum": ["x", 1.5, True, None, [2, "y"]]}},
+            "required": [],
+            "additionalProperties": False,
+        }
+    )
+    input_schema.fields["unset"].Clear()
+    tool_proto = mcp_pb2.Tool(name="kinds_tool", input_schema=input_schema)
+
+    converted_tool = convert.tool_proto_to_type(tool_proto)
+
+    assert converted_tool.inputSchema == json_format.MessageToDict(input_schema)
+    assert converted_tool.inputSchema["unset"] is None
+
+
 def test_tool_proto_to_type_invalid_schema_json():
-    """Test error handling with invalid JSON in schema."""
-    # Create a proto with a schema that will cause json_format.MessageToDict to fail.
-    # This is a bit tricky as Struct naturally handles valid JSON.
-    # We'll mock json_format.MessageToDict to simulate a ParseError.
-    input_schema = {"type": "object", "properties": {"a": {"type": "string"}}}
-    output_schema = {"type": "object", "properties": {"b": {"type": "number"}}}
+    """Test error handling with a schema Struct that no JSON document could produce."""
+    input_schema = struct_pb2.Struct()
+    input_schema.update({"type": "object", "maximum": float("nan")})
     tool_proto = mcp_pb2.Tool(
         name="bad_tool",
         description="Bad schema tool",
-        input_schema=json_format.ParseDict(input_schema, struct_pb2.Struct()),
-        output_schema=json_format.ParseDict(output_schema, struct_pb2.Struct()),
+        input_schema=input_schema,
     )
 
-    with pytest.raises(json_format.ParseError) as excinfo:
-        with unittest.mock.patch.object(
-            json_format,
-            "MessageToDict",
-            side_effect=json_format.ParseError("Invalid JSON"),
-        ):
-            convert.tool_proto_to_type(tool_proto)
-
-    assert str(excinfo.value) == "Invalid JSON"
+    with pytest.raises(json_format.ParseError, match="non-finite"):
+        convert.tool_proto_to_type(tool_proto)
 
 
 def test_tool_type_to_proto_valid():
@@ -440,9 +465,9 @@ def test_tool_type_to_proto_invalid_input_schema():
 
     with pytest.raises(json_format.ParseError) as excinfo:
         with unittest.mock.patch.object(
-            json_format,
-            "ParseDict",
-            side_effect=[json_format.ParseError("Invalid input schema"), None],
+            struct_pb2.Struct,
+            "update",
+            side_effect=[ValueError("Invalid input schema"), None],
         ):
             convert.tool_type_to_proto(tool_type)
 
@@ -460,15 +485,32 @@ def test_tool_type_to_proto_invalid_output_schema():
 
     with pytest.raises(json_format.ParseError) as excinfo:
         with unittest.mock.patch.object(
-            json_format,
-            "ParseDict",
-            side_effect=json_format.ParseError("Invalid output schema"),
+            struct_pb2.Struct,
+            "update",
+            side_effect=ValueError("Invalid output schema"),
         ):
             convert.tool_type_to_proto(tool_type)
 
     assert str(excinfo.value) == "Invalid output schema"
 
 
+@pytest.mark.parametrize(
+    "schema",
+    [
+        pytest.param({"x": object()}, id="unsupported_value"),
+        pytest.param({"properties": {1: {"type": "string"}}}, id="non_string_key"),
+    ],
+)
+@pytest.mark.parametrize("schema_field", ["inputSchema", "outputSchema"])
+def test_tool_type_to_proto_unsupported_schema_values(schema_field: str, schema: dict[str, Any]):
+    """Test that schema values a Struct cannot hold surface as ParseError."""
+    tool_type = types.Tool(name="bad_schema_tool", inputSchema={}, outputSchema={})
+    setattr(tool_type, schema_field, schema)
+
+    with pytest.raises(json_format.ParseError):
+        convert.tool_type_to_proto(tool_type)
+
+
 def test_tool_types_to_protos():
     """Test conversion of a list of types.Tool objects."""
     tool_types = [
@@ -621,6 +663,18 @@ def test_tool_output_to_proto_list_of_content_blocks():
     assert converted_proto[4].embedded_resource.contents.text == "resource"
 
 
+class _CustomTextContent(types.TextContent):
+    pass
+
+
+def test_tool_output_to_proto_content_block_subclass():
+    """Test conversion of tool output that subclasses a content block type."""
+    tool_output = _CustomTextContent(type="text", text="hello from subclass")
+    converted_proto = convert.unstructured_tool_output_to_proto([tool_output])
+    assert len(converted_proto) == 1
+    assert converted_proto[0].text.text == "hello from subclass"
+
+
 def test_tool_output_to_proto_none():
     """Test conversion of tool output as None."""
     tool_output = None
@@ -759,6 +813,26 @@ def test_proto_result_to_content_resource_link_no_name():
     assert types_result.isError is False
 
 
+def test_proto_result_to_content_skips_empty_items():
+    """Test that content items with nothing set are dropped."""
+    empty_embedded_resource = mcp_pb2.CallToolResponse.Content()
+    empty_embedded_resource.embedded_resource.contents.uri = "test://resource"
+    types_result = convert.proto_result_to_content([mcp_pb2.CallToolResponse.Content(), empty_embedded_resource])
+    assert types_result.content == []
+
+
+def test_proto_result_to_content_skips_unknown_fields():
+    """Test that content fields without a converter are skipped instead of raising."""
+    unknown_field = unittest.mock.Mock()
+    unknown_field.name = "video"
+    unknown_item = unittest.mock.Mock()
+    unknown_item.ListFields.return_value = [(unknown_field, unittest.mock.Mock())]
+    text_item = mcp_pb2.CallToolResponse.Content()
+    text_item.text.text = "hello"
+    types_result = convert.proto_result_to_content([unknown_item, text_item])
+    assert types_result.content == [types.TextContent(type="text", text="hello")]
+
+
 def test_proto_result_to_content_structured_content():
     """Test conversion of proto result with structured content to types.CallToolResult."""
     types_result = convert.proto_result_to_content([], structured_content={"key": "value"})
@@ -775,55 +849,84 @@ def test_proto_result_to_content_error():
     assert types_result.isError is True
 
 
-def test_call_tool_request_params_to_proto_basic():
-    """Test basic conversion of CallToolRequestParams to proto."""
-    request_params = types.CallToolRequestParams(name="test_tool", arguments={"arg1": "value1", "arg2": 123})
-
+@pytest.mark.parametrize(
+    "progress_token, progress, total, message, expected_total, expected_message",
+    [
+        pytest.param("token1", 50, 100, "In progress", 100, "In progress", id="all_fields"),
+        # Unset optional fields read back as the proto3 defaults.
+        pytest.param(7, 75, None, None, 0, "", id="minimal_fields"),
+    ],
+)
+def test_progress_notification_to_proto(
+    progress_token: str | int,
+    progress: float,
+    total: float | None,
+    message: str | None,
+    expected_total: float,
+    expected_message: str,
+):
+    """Test conversion of a progress notification to a CallToolResponse proto."""
+    response = convert.progress_notification_to_proto(progress_token, progress, total, message)
+
+    assert isinstance(response, mcp_pb2.CallToolResponse)
+    assert response.common.progress.progress_token == str(progress_token)
+    assert response.common.progress.progress == progress
+    assert response.common.progress.total == expected_total
+    assert response.common.progress.message == expected_message
+    assert not response.content
+
+
+@pytest.mark.parametrize(
+    "request_params, expected_progress_token, expected_arguments",
+    [
+        pytest.param(
+            types.CallToolRequestParams(name="test_tool", arguments={"arg1": "value1", "arg2": 123}),
+            "",
+            {"arg1": "value1", "arg2": 123},
+            id="basic",
+        ),
+        pytest.param(
+            types.CallToolRequestParams(
+                name="progress_tool",
+                arguments={"data": True},
+                _meta=types.RequestParams.Meta(progressToken=99),
+            ),
+            "99",
+            {"data": True},
+            id="with_progress_token",
+        ),
+        # The 'arguments' field will be a default/empty Struct, which is correct.
+        pytest.param(types.CallToolRequestParams(name="simple_tool"), "", {}, id="no_args"),
+    ],
+)
+def test_call_tool_request_params_to_proto(
+    request_params: types.CallToolRequestParams,
+    expected_progress_token: str,
+    expected_arguments: dict[str, Any],
+):
+    """Test conversion of CallToolRequestParams to proto."""
     proto_request = convert.call_tool_request_params_to_proto(request_params)
 
     assert isinstance(proto_request, mcp_pb2.CallToolRequest)
-    assert proto_request.request.name == "test_tool"
-    assert not proto_request.common.progress.progress_token
-
-    expected_args = struct_pb2.Struct()
-    json_format.ParseDict({"arg1": "value1", "arg2": 123}, expected_args)
-    assert proto_request.request.arguments == expected_args
-
-
-def test_call_tool_request_params_to_proto_with_progress_token():
-    """Test conversion with a progress token."""
-    request_params = types.CallToolRequestParams(
-        name="progress_tool",
-        arguments={"data": True},
-        _meta=types.RequestParams.Meta(progressToken=99),
-    )
-
-    proto_request = convert.call_tool_request_params_to_proto(request_params)
-
-    assert proto_request.request.name == "progress_tool"
-    assert proto_request.common.progress.progress_token == "99"
+    assert proto_request.request.name == request_params.name
+    assert proto_request.common.progress.progress_token == expected_progress_token
 
     expected_args = struct_pb2.Struct()
-    json_format.ParseDict({"data": True}, expected_args)
+    json_format.ParseDict(expected_arguments, expected_args)
     assert proto_request.request.arguments == expected_args
 
 
-def test_call_tool_request_params_to_proto_no_args():
-    """Test conversion with no arguments."""
-    request_params = types.CallToolRequestParams(name="simple_tool")
-
-    proto_request = convert.call_tool_request_params_to_proto(request_params)
-
-    assert proto_request.request.name == "simple_tool"
-    # The 'arguments' field will be a default/empty Struct, which is correct.
-    assert not proto_request.request.arguments.fields
-    assert not proto_request.common.progress.progress_token
-
-
-def test_call_tool_request_params_to_proto_parse_error():
+@pytest.mark.parametrize(
+    "bad_arguments",
+    [
+        # Use a non-JSON-serializable type to trigger an error in Struct.update
+        pytest.param({"bad": timedelta(seconds=1)}, id="timedelta_value"),
+        pytest.param({"bad": object()}, id="object_value"),
+        pytest.param({"bad": {1: "one"}}, id="non_string_key"),
+    ],
+)
+def test_call_tool_request_params_to_proto_parse_error(bad_arguments: dict[str, Any]):
     """Test that a ParseError during argument conversion raises McpError."""
-    # Use a non-JSON-serializable type to trigger an error in ParseDict
-    bad_arguments = {"bad": timedelta(seconds=1)}
     request_params = types.CallToolRequestParams(name="bad_args_tool", arguments=bad_arguments)
 
     with pytest.raises(McpError) as excinfo:
@@ -1,5 +1,4 @@
 from typing import Any, cast
-from unittest.mock import AsyncMock, MagicMock
 
 import grpc
 import pytest
@@ -7,13 +6,33 @@ import pytest
 from mcp.shared import grpc_utils, version
 
 
+class FakeServicerContext:
+    """Records the calls get_protocol_version_from_context makes on its context.
+
+    Much cheaper to build than AsyncMock(spec=grpc.aio.ServicerContext), which
+    introspects the whole servicer context class for every test.
+    """
+
+    def __init__(self) -> None:
+        self.metadata: tuple[tuple[str, str], ...] = ()
+        self.aborts: list[tuple[grpc.StatusCode, str]] = []
+        self.sent_initial_metadata: list[Any] = []
+
+    def invocation_metadata(self) -> tuple[tuple[str, str], ...]:
+        return self.metadata
+
+    async def send_initial_metadata(self, initial_metadata: Any) -> None:
+        self.sent_initial_metadata.append(initial_metadata)
+
+    async def abort(self, code: grpc.StatusCode, details: str) -> None:
+        # Like grpc.aio, abort never returns normally.
+        self.aborts.append((code, details))
+        raise grpc.RpcError("Aborted")
+
+
 @pytest.fixture
-def mock_context() -> Any:
-    context = AsyncMock(spec=grpc.aio.ServicerContext)
-    context.abort = AsyncMock()
-    context.invocation_metadata = MagicMock(return_value=())
-    context.send_initial_metadata = AsyncMock()
-    return context
+def mock_context() -> FakeServicerContext:
+    return FakeServicerContext()
 
 
 def test_get_metadata_value_found_string():
@@ -53,52 +72,72 @@ def test_get_metadata_value_none_metadata():
 
 
 @pytest.mark.asyncio
-async def test_get_protocol_version_from_context_no_version(mock_context: Any):
+async def test_get_protocol_version_from_context_no_version(mock_context: FakeServicerContext):
     """Test aborting when no protocol version is provided in metadata."""
-    mock_context.invocation_metadata.return_value = ()
+    mock_context.metadata = ()
     supported_versions = version.SUPPORTED_PROTOCOL_VERSIONS
-    mock_context.abort.side_effect = grpc.RpcError("Aborted")
 
     with pytest.raises(grpc.RpcError):
-        await grpc_utils.get_protocol_version_from_context(mock_context, supported_versions)
+        await grpc_utils.get_protocol_version_from_context(cast(Any, mock_context), supported_versions)
 
-    mock_context.send_initial_metadata.assert_called_once_with(
+    assert mock_context.sent_initial_metadata == [
         [(grpc_utils.MCP_PROTOCOL_VERSION_KEY, version.LATEST_PROTOCOL_VERSION)]
-    )
-    mock_context.abort.assert_called_once_with(
-        grpc.StatusCode.UNIMPLEMENTED,
-        "Protocol version not provided. Supported versions are: 2024-11-05, 2025-03-26, 2025-06-18, 2025-11-25",
-    )
+    ]
+    assert mock_context.aborts == [
+        (
+            grpc.StatusCode.UNIMPLEMENTED,
+            "Protocol version not provided. Supported versions are: 2024-11-05, 2025-03-26, 2025-06-18, 2025-11-25",
+        )
+    ]
 
 
 @pytest.mark.asyncio
-async def test_get_protocol_version_from_context_unsupported_version(mock_context: Any):
+async def test_get_protocol_version_from_context_unsupported_version(mock_context: FakeServicerContext):
     """Test aborting when an unsupported protocol version is provided."""
-    mock_context.invocation_metadata.return_value = ((grpc_utils.MCP_PROTOCOL_VERSION_KEY, "unsupported"),)
+    mock_context.metadata = ((grpc_utils.MCP_PROTOCOL_VERSION_KEY, "unsupported"),)
     supported_versions = version.SUPPORTED_PROTOCOL_VERSIONS
-    mock_context.abort.side_effect = grpc.RpcError("Aborted")
 
     with pytest.raises(grpc.RpcError):
-        await grpc_utils.get_protocol_version_from_context(mock_context, supported_versions)
+        await grpc_utils.get_protocol_version_from_context(cast(Any, mock_context), supported_versions)
 
-    mock_context.send_initial_metadata.assert_called_once_with(
+    assert mock_context.sent_initial_metadata == [
         [(grpc_utils.MCP_PROTOCOL_VERSION_KEY, version.LATEST_PROTOCOL_VERSION)]
-    )
-    mock_context.abort.assert_called_once_with(
-        grpc.StatusCode.UNIMPLEMENTED,
-        "Unsupported protocol version: unsupported. "
-        + "Supported versions are: 2024-11-05, 2025-03-26, 2025-06-18, 2025-11-25",
-    )
+    ]
+    assert mock_context.aborts == [
+        (
+            grpc.StatusCode.UNIMPLEMENTED,
+            "Unsupported protocol version: unsupported. "
+            + "Supported versions are: 2024-11-05, 2025-03-26, 2025-06-18, 2025-11-25",
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_protocol_version_from_context_custom_supported_versions(mock_context: FakeServicerContext):
+    """Test the abort message lists a caller-provided set of supported versions."""
+    mock_context.metadata = ((grpc_utils.MCP_PROTOCOL_VERSION_KEY, "unsupported"),)
+
+    with pytest.raises(grpc.RpcError):
+        await grpc_utils.get_protocol_version_from_context(cast(Any, mock_context), ["2025-06-18", "2025-11-25"])
+
+    assert mock_context.aborts == [
+        (
+            grpc.StatusCode.UNIMPLEMENTED,
+            "Unsupported protocol version: unsupported. Supported versions are: 2025-06-18, 2025-11-25",
+        )
+    ]
 
 
 @pytest.mark.asyncio
-async def test_get_protocol_version_from_context_supported_version(mock_context: Any):
+async def test_get_protocol_version_from_context_supported_version(mock_context: FakeServicerContext):
     """Test success when a supported protocol version is provided."""
     test_version = version.SUPPORTED_PROTOCOL_VERSIONS[0]
-    mock_context.invocation_metadata.return_value = ((grpc_utils.MCP_PROTOCOL_VERSION_KEY, test_version),)
+    mock_context.metadata = ((grpc_utils.MCP_PROTOCOL_VERSION_KEY, test_version),)
     supported_versions = version.SUPPORTED_PROTOCOL_VERSIONS
 
-    result = await grpc_utils.get_protocol_version_from_context(mock_context, supported_versions)
+    result = await grpc_utils.get_protocol_version_from_context(cast(Any, mock_context), supported_versions)
 
     assert result == test_version
-    mock_context.abort.assert_not_called()
+    assert mock_context.aborts == []
+    # On success the version is echoed by the calling decorator, not here.
+    assert mock_context.sent_initial_metadata == []
@@ -3,6 +3,19 @@
 import socket
 import time
 
+# Keepalive pings hold a shared gRPC test channel open between tests.
+GRPC_KEEPALIVE_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 10_000),
+    ("grpc.keepalive_timeout_ms", 5_000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+]
+# The server must accept those pings, or it answers them with a GOAWAY for too many pings.
+GRPC_KEEPALIVE_SERVER_OPTIONS = [
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.min_ping_interval_without_data_ms", 5_000),
+]
+
 
 def wait_for_server(port: int, timeout: float = 20.0) -> None:
     """Wait for server to be ready to accept connections.